@@ -1,6 +1,5 @@
-from collections.abc import Collection
-import functools
-from typing import Final
+from collections.abc import Collection, Sequence
+from typing import ClassVar, Final
 
 from mypy.argmap import map_formals_to_actuals
 from mypy.checker import TypeChecker
@@ -8,25 +7,44 @@ from mypy.nodes import ArgKind, CallExpr, Expression
 from mypy.typeops import bind_self
 from mypy.types import CallableType, FunctionLike, Instance, Overloaded, Type
 
+from .utils import ScopedCache
+
 type ArgMap = dict[str, Expression]
+type ArgIndices = dict[str, int]
+type ArgLayout = tuple[tuple[ArgKind, ...], tuple[str | None, ...]]
+type OverloadedKey = tuple[CallExpr | ArgLayout, tuple[ArgLayout, ...], frozenset[str] | None]
 
 
 class ArgMapper:
     ACCEPTED_ARG_KINDS: Final[Collection[ArgKind]] = (ArgKind.ARG_POS, ArgKind.ARG_NAMED)
+    _actuals_to_formals_cache: ClassVar[
+        ScopedCache[tuple[CallExpr | ArgLayout, ArgLayout], Sequence[Sequence[int]]]
+    ] = ScopedCache()
+    _overload_layouts_cache: ClassVar[
+        ScopedCache[int, tuple[Overloaded, tuple[ArgLayout, ...]]]
+    ] = ScopedCache()
+    _overloaded_indices_cache: ClassVar[ScopedCache[OverloadedKey, ArgIndices]] = ScopedCache()
 
     @classmethod
-    def named_arg_mapping(cls, call: CallExpr, checker: TypeChecker) -> ArgMap:
+    def named_arg_mapping(
+        cls, call: CallExpr, checker: TypeChecker, *, names: Collection[str] | None = None
+    ) -> ArgMap:
         callee_type = checker.lookup_type(call.callee)
-        return cls._named_arg_type_mapping(call, callee_type, checker)
+        return cls._named_arg_type_mapping(call, callee_type, checker, names=names)
 
     @classmethod
     def _named_arg_type_mapping(
-        cls, call: CallExpr, callee_type: Type, checker: TypeChecker
+        cls,
+        call: CallExpr,
+        callee_type: Type,
+        checker: TypeChecker,
+        *,
+        names: Collection[str] | None,
     ) -> ArgMap:
         if isinstance(callee_type, CallableType):
-            return cls._named_arg_callable_mapping(call, callee_type, checker)
+            return cls._named_arg_callable_mapping(call, callee_type, checker, names=names)
         if isinstance(callee_type, Overloaded):
-            return cls._named_arg_overloaded_mapping(call, callee_type, checker)
+            return cls._named_arg_overloaded_mapping(call, callee_type, checker, names=names)
         if (
             isinstance(callee_type, Instance)
             and (call_node := callee_type.type.names.get("__call__")) is not None
@@ -35,45 +53,133 @@ class ArgMapper:
             type_ = call_node.type
             if isinstance(type_, FunctionLike):
                 type_ = bind_self(type_, callee_type)
-                return cls._named_arg_type_mapping(call, type_, checker)
+                return cls._named_arg_type_mapping(call, type_, checker, names=names)
         return {}
 
     @classmethod
     def _named_arg_callable_mapping(
-        cls, call: CallExpr, callee_type: CallableType, checker: TypeChecker
+        cls,
+        call: CallExpr,
+        callee_type: CallableType,
+        checker: TypeChecker,
+        *,
+        names: Collection[str] | None,
     ) -> ArgMap:
-        mapping = map_formals_to_actuals(
-            actual_kinds=call.arg_kinds,
-            actual_names=call.arg_names,
-            formal_kinds=callee_type.arg_kinds,
-            formal_names=callee_type.arg_names,
-            actual_arg_type=lambda i: call.args[i].accept(checker.expr_checker),
-        )
+        arg_indices = cls._callable_arg_indices(call, callee_type, checker, names=names)
+        return cls._arg_map(call, arg_indices)
 
+    @classmethod
+    def _callable_arg_indices(
+        cls,
+        call: CallExpr,
+        callee_type: CallableType,
+        checker: TypeChecker,
+        *,
+        names: Collection[str] | None,
+    ) -> ArgIndices:
+        mapping = cls.actuals_to_formals(call, callee_type, checker)
         return {
-            arg_name: call.args[actual_idx]
+            arg_name: actual_idx
             for actual_idx, formal_idxs in enumerate(mapping)
             if len(formal_idxs) == 1
             and callee_type.arg_kinds[formal_idx := formal_idxs[0]] in cls.ACCEPTED_ARG_KINDS
             and formal_idx < len(callee_type.arg_names)
             and (arg_name := callee_type.arg_names[formal_idx]) is not None
+            and (names is None or arg_name in names)
         }
 
+    @classmethod
+    def _arg_map(cls, call: CallExpr, arg_indices: ArgIndices) -> ArgMap:
+        return {arg_name: call.args[actual_idx] for arg_name, actual_idx in arg_indices.items()}
+
+    @classmethod
+    def actuals_to_formals(
+        cls, call: CallExpr, callee_type: CallableType, checker: TypeChecker
+    ) -> Sequence[Sequence[int]]:
+        return cls._actuals_to_formals_cache.get(
+            checker.tree,
+            (cls._actual_layout(call), cls._formal_layout(callee_type)),
+            lambda: map_formals_to_actuals(
+                actual_kinds=call.arg_kinds,
+                actual_names=call.arg_names,
+                formal_kinds=callee_type.arg_kinds,
+                formal_names=callee_type.arg_names,
+                actual_arg_type=lambda i: cls._actual_arg_type(call.args[i], checker),
+            ),
+        )
+
+    @classmethod
+    def _actual_layout(cls, call: CallExpr) -> CallExpr | ArgLayout:
+        if any(arg_kind.is_star() for arg_kind in call.arg_kinds):
+            return call
+        return tuple(call.arg_kinds), tuple(call.arg_names)
+
+    @classmethod
+    def _formal_layout(cls, callee_type: CallableType) -> ArgLayout:
+        return tuple(callee_type.arg_kinds), tuple(callee_type.arg_names)
+
+    @classmethod
+    def _actual_arg_type(cls, arg: Expression, checker: TypeChecker) -> Type:
+        type_ = checker.lookup_type_or_none(arg)
+        if type_ is None:
+            return arg.accept(checker.expr_checker)
+        return type_
+
     @classmethod
     def _named_arg_overloaded_mapping(
-        cls, call: CallExpr, callee_type: Overloaded, checker: TypeChecker
+        cls,
+        call: CallExpr,
+        callee_type: Overloaded,
+        checker: TypeChecker,
+        *,
+        names: Collection[str] | None,
     ) -> ArgMap:
-        return functools.reduce(
-            cls._merge_mappings,
-            (
-                cls._named_arg_callable_mapping(call, callable_type, checker)
-                for callable_type in callee_type.items
-            ),
+        key = (
+            cls._actual_layout(call),
+            cls._overload_layouts(callee_type, checker),
+            None if names is None else frozenset(names),
+        )
+        arg_indices = cls._overloaded_indices_cache.get(
+            checker.tree,
+            key,
+            lambda: cls._overloaded_arg_indices(call, callee_type, checker, names=names),
+        )
+        return cls._arg_map(call, arg_indices)
+
+    @classmethod
+    def _overload_layouts(
+        cls, callee_type: Overloaded, checker: TypeChecker
+    ) -> tuple[ArgLayout, ...]:
+        cached = cls._overload_layouts_cache.lookup(checker.tree, id(callee_type))
+        if cached is not None and cached[0] is callee_type:
+            return cached[1]
+        layouts = tuple(map(cls._formal_layout, callee_type.items))
+        cls._overload_layouts_cache.put(checker.tree, id(callee_type), (callee_type, layouts))
+        return layouts
+
+    @classmethod
+    def _overloaded_arg_indices(
+        cls,
+        call: CallExpr,
+        callee_type: Overloaded,
+        checker: TypeChecker,
+        *,
+        names: Collection[str] | None,
+    ) -> ArgIndices:
+        all_indices = (
+            cls._callable_arg_indices(call, callable_type, checker, names=names)
+            for callable_type in callee_type.items
         )
+        arg_indices = next(all_indices)
+        for other_indices in all_indices:
+            if not arg_indices:
+                break
+            arg_indices = cls._merge_indices(arg_indices, other_indices)
+        return arg_indices
 
     @classmethod
-    def _merge_mappings(cls, this: ArgMap, that: ArgMap) -> ArgMap:
-        return {key: expr for key, expr in this.items() if that.get(key, None) is expr}
+    def _merge_indices(cls, this: ArgIndices, that: ArgIndices) -> ArgIndices:
+        return {key: idx for key, idx in this.items() if that.get(key, None) == idx}
 
     @classmethod
     def named_arg(cls, call: CallExpr, name: str) -> Expression | None:
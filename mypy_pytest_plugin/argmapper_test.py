@@ -1,19 +1,23 @@
 from typing import Any, cast
+from unittest import mock
 
 from mypy.nodes import CallExpr, Expression
+from mypy.types import CallableType
 
 from .argmapper import ArgMapper
 from .test_utils import dump_expr, parse
 
 
-def _named_arg_mapping_test_body(defs: str, expected_keys: list[str]) -> None:
+def _named_arg_mapping_test_body(
+    defs: str, expected_keys: list[str], *, names: list[str] | None = None
+) -> None:
     parse_result = parse(defs)
     parse_result.accept_all()
 
     call = parse_result.defs["call"]
     assert isinstance(call, CallExpr)
 
-    raw_arg_map = ArgMapper.named_arg_mapping(call, parse_result.checker)
+    raw_arg_map = ArgMapper.named_arg_mapping(call, parse_result.checker, names=names)
 
     def dump_arg_map(arg_map: dict[str, Expression]) -> dict[str, tuple[type, dict[str, Any]]]:
         return {key: (dump_expr(expr)) for key, expr in arg_map.items()}
@@ -181,3 +185,123 @@ def test_named_arg_mapping_call_method() -> None:
         """,
         ["x", "y"],
     )
+
+
+def test_named_arg_mapping_star_args_tuple() -> None:
+    _named_arg_mapping_test_body(
+        """
+        def main(x: int, y: str, z: bool) -> int:
+            return 0
+
+        call = main(*(1, "2"), z=True)
+        z = True
+        """,
+        ["z"],
+    )
+
+
+def test_actuals_to_formals_memoised_per_call() -> None:
+    parse_result = parse(
+        """
+        def main(x: int, *args: str) -> int:
+            return 0
+
+        call = main(0, *["1", "2"])
+        """
+    )
+    parse_result.accept_all()
+
+    call = parse_result.defs["call"]
+    assert isinstance(call, CallExpr)
+    callee_type = parse_result.checker.lookup_type(call.callee)
+    assert isinstance(callee_type, CallableType)
+
+    mapping = ArgMapper.actuals_to_formals(call, callee_type, parse_result.checker)
+    assert mapping == [[0], [1]]
+    assert ArgMapper.actuals_to_formals(call, callee_type, parse_result.checker) is mapping
+
+
+def test_named_arg_mapping_overload_restricted_names() -> None:
+    _named_arg_mapping_test_body(
+        """
+        from typing import overload
+
+        @overload
+        def foo(x: int, y: str, *, z: bool) -> int:
+            ...
+
+        @overload
+        def foo(x: int, y: str) -> int:
+            ...
+
+        def foo(x: int, y: str, **kwargs: bool) -> int:
+            return 0
+
+        call = foo(2, "0", z=False)
+        y = "0"
+        """,
+        ["y"],
+        names=["y", "z"],
+    )
+
+
+def test_actuals_to_formals_shared_between_calls_with_same_layout() -> None:
+    parse_result = parse(
+        """
+        def main(x: int, y: str) -> int:
+            return 0
+
+        call = main(0, y="1")
+        other_call = main(2, y="3")
+        """
+    )
+    parse_result.accept_all()
+
+    call = parse_result.defs["call"]
+    other_call = parse_result.defs["other_call"]
+    assert isinstance(call, CallExpr)
+    assert isinstance(other_call, CallExpr)
+    callee_type = parse_result.checker.lookup_type(call.callee)
+    assert isinstance(callee_type, CallableType)
+
+    mapping = ArgMapper.actuals_to_formals(call, callee_type, parse_result.checker)
+    assert mapping == [[0], [1]]
+    assert ArgMapper.actuals_to_formals(other_call, callee_type, parse_result.checker) is mapping
+
+
+def test_named_arg_mapping_overload_shared_between_calls_with_same_layout() -> None:
+    parse_result = parse(
+        """
+        from typing import overload
+
+        @overload
+        def foo(x: int, y: str) -> int:
+            ...
+
+        @overload
+        def foo(x: int, y: str, z: bool) -> int:
+            ...
+
+        def foo(x: int, y: str, z: bool = False) -> int:
+            return 0
+
+        call = foo(0, y="1")
+        other_call = foo(2, y="3")
+        """
+    )
+    parse_result.accept_all()
+
+    call = parse_result.defs["call"]
+    other_call = parse_result.defs["other_call"]
+    assert isinstance(call, CallExpr)
+    assert isinstance(other_call, CallExpr)
+
+    with mock.patch.object(
+        ArgMapper, "_callable_arg_indices", side_effect=ArgMapper._callable_arg_indices
+    ) as callable_arg_indices:
+        mapping = ArgMapper.named_arg_mapping(call, parse_result.checker)
+        other_mapping = ArgMapper.named_arg_mapping(other_call, parse_result.checker)
+
+    assert callable_arg_indices.call_count == 2
+    assert mapping == dict(zip(["x", "y"], call.args, strict=True))
+    assert other_mapping == dict(zip(["x", "y"], other_call.args, strict=True))
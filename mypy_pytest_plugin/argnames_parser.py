@@ -13,14 +13,10 @@ from .error_codes import (
     UNREADABLE_ARGNAMES,
 )
 from .names_parser import NamesParser
-from .utils import cache_by_id
 
 
 @dataclass(frozen=True)
 class ArgnamesParser(NamesParser):
-    def __post_init__(self) -> None:
-        object.__setattr__(self, "parse_names", cache_by_id(self.parse_names))
-
     def parse_names(self, expression: Expression) -> str | list[str] | None:
         match expression:
             case StrExpr():
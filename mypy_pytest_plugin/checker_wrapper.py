@@ -1,7 +1,6 @@
 import abc
-from collections.abc import Callable
-import functools
-from typing import Any, TypeGuard, cast, overload
+from collections.abc import Callable, Iterable
+from typing import Any, ClassVar, TypeGuard, cast, overload
 
 from mypy.checker import TypeChecker
 from mypy.errorcodes import NAME_DEFINED, ErrorCode
@@ -9,11 +8,17 @@ from mypy.nodes import Context, MypyFile, TypeInfo
 from mypy.types import AnyType, Instance, Type, TypeOfAny
 
 from .fullname import Fullname
+from .utils import ScopedCache
+
+type LookupCandidates = tuple[tuple[MypyFile, Any], ...]
+type ModuleSplits = tuple[tuple[MypyFile, tuple[str, ...]], ...]
 
 
 class CheckerWrapper(abc.ABC):
     checker: TypeChecker
 
+    _module_split_cache: ClassVar[ScopedCache[str, tuple[int, ModuleSplits]]] = ScopedCache()
+
     @abc.abstractmethod
     def __init__(self) -> None: ...
 
@@ -23,7 +28,6 @@ class CheckerWrapper(abc.ABC):
     def note(self, msg: str, *, context: Context, code: ErrorCode | None) -> None:
         self.checker.note(msg, context=context, code=code)
 
-    @functools.lru_cache  # noqa: B019
     def named_type(self, fullname: Fullname) -> Instance:
         node = self.lookup_fullname(
             fullname,
@@ -74,35 +78,52 @@ class CheckerWrapper(abc.ABC):
         context: Context | None = None,
         predicate: Callable[[Any], bool] | None = None,
     ) -> tuple[MypyFile, Any] | None:
-        module_name, target = (Fullname(()), fullname)
-        while target:
-            module_name = module_name.push_back(target.head)
-            target = target.pop_front()
-            if (module := self.checker.modules.get(str(module_name))) and (
-                result := self._lookup_fullname_in_module(module, target, predicate=predicate)
-            ):
-                return module, result
+        for module, resource in self._lookup_candidates(fullname):
+            if predicate is None or predicate(resource):
+                return module, resource
         if context is not None:
             self.fail(f"'{fullname!s}' does not exist.", context=context, code=NAME_DEFINED)
         return None
 
-    @overload
-    def _lookup_fullname_in_module[T](
-        self, module: MypyFile, target: Fullname, *, predicate: Callable[[Any], TypeGuard[T]]
-    ) -> T | None: ...
-    @overload
-    def _lookup_fullname_in_module(
-        self, module: MypyFile, target: Fullname, *, predicate: Callable[[Any], bool] | None
-    ) -> Any | None: ...
-    def _lookup_fullname_in_module(
-        self, module: MypyFile, target: Fullname, *, predicate: Callable[[Any], bool] | None
-    ) -> Any | None:
+    def _lookup_candidates(self, fullname: Fullname) -> LookupCandidates:
+        return tuple(
+            (module, resource)
+            for module, target in self._module_splits(str(fullname))
+            if (resource := self._lookup_fullname_in_module(module, target))
+        )
+
+    def _is_fresh(self, module_count: int, entries: tuple[tuple[MypyFile, object], ...]) -> bool:
+        return module_count == len(self.checker.modules) and self._are_current(entries)
+
+    def _are_current(self, entries: tuple[tuple[MypyFile, object], ...]) -> bool:
+        return all(self.checker.modules.get(module.fullname) is module for module, _ in entries)
+
+    def _module_splits(self, dotted_name: str) -> ModuleSplits:
+        cached = self._module_split_cache.lookup(self.checker.modules, dotted_name)
+        if cached is not None and self._is_fresh(*cached):
+            _module_count, splits = cached
+            return splits
+        splits = self._split_modules(dotted_name)
+        self._module_split_cache.put(
+            self.checker.modules, dotted_name, (len(self.checker.modules), splits)
+        )
+        return splits
+
+    def _split_modules(self, dotted_name: str) -> ModuleSplits:
+        parts = dotted_name.split(".")
+        splits = []
+        module_name = ""
+        for index, part in enumerate(parts, start=1):
+            module_name = f"{module_name}.{part}" if module_name else part
+            if (module := self.checker.modules.get(module_name)) is not None:
+                splits.append((module, tuple(parts[index:])))
+        return tuple(splits)
+
+    def _lookup_fullname_in_module(self, module: MypyFile, target: Iterable[str]) -> Any | None:
         resource: Any = module
         for name in target:
             try:
                 resource = resource.names[name].node
             except (KeyError, AttributeError):
                 return None
-        if predicate is None or predicate(resource):
-            return resource
-        return None
+        return resource
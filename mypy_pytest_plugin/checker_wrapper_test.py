@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from unittest import mock
 
 from mypy.checker import TypeChecker
+from mypy.nodes import GDEF, MypyFile, SymbolTableNode, Var
 from mypy.subtypes import is_same_type
 
 from .checker_wrapper import CheckerWrapper
@@ -170,3 +172,89 @@ def test_lookup_fullname_many_nested_modules_does_not_exist() -> None:
 
 def test_lookup_fullname_many_nested_modules_exists_as_module() -> None:
     _lookup_fullname_type_test_body([("test_module", ""), ("test_module.x", "")], "test_module.x")
+
+
+def test_lookup_fullname_shared_between_wrappers() -> None:
+    parse_result = parse_multiple([("test_module", "x: int")])
+    checker = parse_result.checkers["test_module"]
+    fullname = Fullname.from_string("test_module.x")
+    with mock.patch.object(
+        CheckerWrapperMock,
+        "_split_modules",
+        autospec=True,
+        side_effect=CheckerWrapperMock._split_modules,
+    ) as split_modules:
+        first = CheckerWrapperMock(checker).lookup_fullname_type(fullname)
+        second = CheckerWrapperMock(checker).lookup_fullname_type(fullname)
+    assert first is not None
+    assert first is second
+    split_modules.assert_called_once()
+
+
+def test_lookup_fullname_replaced_symbol() -> None:
+    parse_result = parse_multiple([("test_module", "x: int")])
+    checker = parse_result.checkers["test_module"]
+    fullname = Fullname.from_string("test_module.x")
+    names = checker.modules["test_module"].names
+    assert CheckerWrapperMock(checker).lookup_fullname_type(fullname) is not None
+
+    original = names["x"]
+    replacement = Var("x", checker.named_type("builtins.str"))
+    names["x"] = SymbolTableNode(GDEF, replacement)
+    try:
+        type_ = CheckerWrapperMock(checker).lookup_fullname_type(fullname)
+    finally:
+        names["x"] = original
+    assert type_ is replacement.type
+
+
+def test_lookup_fullname_replaced_module() -> None:
+    parse_result = parse_multiple([("test_module", "x: int")])
+    checker = parse_result.checkers["test_module"]
+    fullname = Fullname.from_string("test_module.x")
+    original = checker.modules["test_module"]
+    assert CheckerWrapperMock(checker).lookup_fullname_type(fullname) is not None
+
+    replacement = MypyFile([], [])
+    replacement._fullname = original.fullname
+    checker.modules["test_module"] = replacement
+    try:
+        assert CheckerWrapperMock(checker).lookup_fullname_type(fullname) is None
+    finally:
+        checker.modules["test_module"] = original
+
+
+def test_module_splits_memoised_for_missing_names() -> None:
+    parse_result = parse_multiple([("a", "x: int"), ("a.b", "y: int")])
+    checker = parse_result.checkers["a.b"]
+    with mock.patch.object(
+        CheckerWrapperMock,
+        "_split_modules",
+        autospec=True,
+        side_effect=CheckerWrapperMock._split_modules,
+    ) as split_modules:
+        for _ in range(2):
+            assert (
+                CheckerWrapperMock(checker).lookup_fullname_type(Fullname.from_string("a.b.z"))
+                is None
+            )
+        splits = CheckerWrapperMock(checker)._module_splits("a.b.z")
+    split_modules.assert_called_once()
+    assert [(module.fullname, target) for module, target in splits] == [
+        ("a", ("b", "z")),
+        ("a.b", ("z",)),
+    ]
+
+
+def test_lookup_fullname_module_added_after_miss() -> None:
+    parse_result = parse_multiple([("a", "x: int"), ("a.b", "y: int")])
+    checker = parse_result.checkers["a.b"]
+    fullname = Fullname.from_string("a.b.y")
+    nested = checker.modules.pop("a.b")
+    try:
+        assert CheckerWrapperMock(checker).lookup_fullname_type(fullname) is None
+    finally:
+        checker.modules["a.b"] = nested
+    type_ = CheckerWrapperMock(checker).lookup_fullname_type(fullname)
+    assert type_ is not None
+    assert str(type_) == "int"
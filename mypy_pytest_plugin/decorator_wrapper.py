@@ -1,14 +1,16 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
 import functools
-from typing import Self, TypeGuard
+from typing import ClassVar, Self, TypeGuard
 
 from mypy.checker import TypeChecker
 from mypy.nodes import CallExpr, Expression
 from mypy.types import Instance
 
 from .argmapper import ArgMapper
+from .argnames_parser import ArgnamesParser
 from .checker_wrapper import CheckerWrapper
+from .defer import DeferralError, DeferralReason
 from .error_codes import UNREADABLE_ARGNAMES_ARGVALUES
 
 
@@ -16,6 +18,7 @@ from .error_codes import UNREADABLE_ARGNAMES_ARGVALUES
 class DecoratorWrapper(CheckerWrapper):
     call: CallExpr
     checker: TypeChecker
+    PARAMETRIZE_TYPE_FULLNAME: ClassVar[str] = "_pytest.mark.structures._ParametrizeMarkDecorator"
 
     @classmethod
     def decorators_from_exprs(
@@ -32,16 +35,20 @@ class DecoratorWrapper(CheckerWrapper):
         cls, expr: Expression, checker: TypeChecker
     ) -> TypeGuard[CallExpr]:
         if isinstance(expr, CallExpr):
-            callee_type = expr.callee.accept(checker.expr_checker)
+            callee_type = checker.lookup_type_or_none(expr.callee)
+            if callee_type is None:
+                raise DeferralError(DeferralReason.REQUIRED_WAIT)
             return (
                 isinstance(callee_type, Instance)
-                and callee_type.type.fullname == "_pytest.mark.structures._ParametrizeMarkDecorator"
+                and callee_type.type.fullname == cls.PARAMETRIZE_TYPE_FULLNAME
             )
         return False
 
     @functools.cached_property
     def arg_names_and_arg_values(self) -> tuple[Expression, Expression] | None:
-        name_mapping = ArgMapper.named_arg_mapping(self.call, self.checker)
+        name_mapping = ArgMapper.named_arg_mapping(
+            self.call, self.checker, names=("argnames", "argvalues")
+        )
         try:
             return name_mapping["argnames"], name_mapping["argvalues"]
         except KeyError:
@@ -58,3 +65,9 @@ class DecoratorWrapper(CheckerWrapper):
             return None
         arg_names, _arg_values = self.arg_names_and_arg_values
         return arg_names
+
+    @functools.cached_property
+    def parsed_arg_names(self) -> str | list[str] | None:
+        if self.arg_names is None:
+            return None
+        return ArgnamesParser(self.checker).parse_names(self.arg_names)
@@ -1,4 +1,9 @@
-from .test_utils import test_info_from_defs
+from mypy.nodes import Decorator
+import pytest
+
+from .decorator_wrapper import DecoratorWrapper
+from .defer import DeferralError
+from .test_utils import parse, test_info_from_defs
 
 
 def _decorator_wrapper_from_node_test_body(defs: str, is_decorator: bool) -> None:
@@ -75,3 +80,24 @@ def test_decorator_wrapper_from_different_call() -> None:
         """,
         False,
     )
+
+
+def test_decorator_wrapper_from_unchecked_node_defers() -> None:
+    parse_result = parse(
+        """
+        import pytest
+
+        @pytest.mark.parametrize(
+            "foo",
+            [1, 2, 3]
+        )
+        def test_info(foo: int) -> None:
+            ...
+        """
+    )
+    test_node = parse_result.defs["test_info"]
+    assert isinstance(test_node, Decorator)
+    with pytest.raises(DeferralError):
+        DecoratorWrapper.decorators_from_exprs(
+            test_node.original_decorators, checker=parse_result.checker
+        )
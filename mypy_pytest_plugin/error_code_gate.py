@@ -0,0 +1,56 @@
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+import enum
+from typing import ClassVar
+
+from mypy.checker import TypeChecker
+from mypy.errorcodes import ErrorCode
+
+from .error_codes import (
+    FIXTURE_ARGUMENT_TYPE,
+    INVERTED_FIXTURE_SCOPE,
+    ITERABLE_SEQUENCE,
+    MISSING_ARGNAME,
+    PARAM_USEFIXTURES,
+    TEST_RETURN_TYPE,
+    UNKNOWN_MARK,
+)
+from .utils import ScopedCache
+
+
+class Analysis(enum.Enum):
+    ITERABLE_SEQUENCE = enum.auto()
+    MARK_NAMES = enum.auto()
+    PARAM_MARKS = enum.auto()
+    TEST_RETURN_TYPE = enum.auto()
+    FIXTURE_RESOLUTION = enum.auto()
+    FIXTURE_SCOPE = enum.auto()
+    FIXTURE_ARGUMENT_TYPE = enum.auto()
+
+
+@dataclass(frozen=True, slots=True)
+class ErrorCodeGate:
+    checker: TypeChecker
+
+    ANALYSIS_CODES: ClassVar[Mapping[Analysis, Collection[ErrorCode]]] = {
+        Analysis.ITERABLE_SEQUENCE: (ITERABLE_SEQUENCE,),
+        Analysis.MARK_NAMES: (UNKNOWN_MARK,),
+        Analysis.PARAM_MARKS: (PARAM_USEFIXTURES,),
+        Analysis.TEST_RETURN_TYPE: (TEST_RETURN_TYPE,),
+        Analysis.FIXTURE_RESOLUTION: (MISSING_ARGNAME,),
+        Analysis.FIXTURE_SCOPE: (INVERTED_FIXTURE_SCOPE,),
+        Analysis.FIXTURE_ARGUMENT_TYPE: (FIXTURE_ARGUMENT_TYPE,),
+    }
+
+    _enabled_cache: ClassVar[ScopedCache[Analysis, bool]] = ScopedCache()
+
+    def is_enabled(self, *analyses: Analysis) -> bool:
+        return any(map(self._is_analysis_enabled, analyses))
+
+    def _is_analysis_enabled(self, analysis: Analysis) -> bool:
+        return self._enabled_cache.get(
+            self.checker.errors.options, analysis, lambda: self._any_code_enabled(analysis)
+        )
+
+    def _any_code_enabled(self, analysis: Analysis) -> bool:
+        return any(map(self.checker.errors.is_error_code_enabled, self.ANALYSIS_CODES[analysis]))
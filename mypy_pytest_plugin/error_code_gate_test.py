@@ -0,0 +1,49 @@
+from mypy.errorcodes import ErrorCode
+import pytest
+
+from .error_code_gate import Analysis, ErrorCodeGate
+from .error_codes import FIXTURE_ARGUMENT_TYPE, INVERTED_FIXTURE_SCOPE, ITERABLE_SEQUENCE
+from .test_utils import parse
+
+
+def _error_code_gate_test_body(
+    disabled: list[ErrorCode], analyses: list[Analysis], expected: bool
+) -> None:
+    checker = parse("").checker
+    options = checker.options.apply_changes({})
+    options.disabled_error_codes.update(disabled)
+    checker.errors.set_file(checker.path, checker.tree.fullname, options=options)
+    assert ErrorCodeGate(checker).is_enabled(*analyses) is expected
+
+
+@pytest.mark.parametrize(
+    "disabled, analyses, expected",
+    [
+        ([], [Analysis.ITERABLE_SEQUENCE], True),
+        ([ITERABLE_SEQUENCE], [Analysis.ITERABLE_SEQUENCE], False),
+        ([ITERABLE_SEQUENCE], [Analysis.FIXTURE_SCOPE], True),
+        (
+            [INVERTED_FIXTURE_SCOPE],
+            [Analysis.FIXTURE_SCOPE, Analysis.FIXTURE_ARGUMENT_TYPE],
+            True,
+        ),
+        (
+            [INVERTED_FIXTURE_SCOPE, FIXTURE_ARGUMENT_TYPE],
+            [Analysis.FIXTURE_SCOPE, Analysis.FIXTURE_ARGUMENT_TYPE],
+            False,
+        ),
+    ],
+)
+def test_error_code_gate_is_enabled(
+    disabled: list[ErrorCode], analyses: list[Analysis], expected: bool
+) -> None:
+    _error_code_gate_test_body(disabled, analyses, expected)
+
+
+def test_error_code_gate_reevaluates_for_module_options() -> None:
+    _error_code_gate_test_body([ITERABLE_SEQUENCE], [Analysis.ITERABLE_SEQUENCE], False)
+    _error_code_gate_test_body([], [Analysis.ITERABLE_SEQUENCE], True)
+
+
+def test_error_code_gate_covers_every_analysis() -> None:
+    assert set(ErrorCodeGate.ANALYSIS_CODES) == set(Analysis)
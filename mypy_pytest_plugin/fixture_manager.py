@@ -1,24 +1,26 @@
+from __future__ import annotations
+
 from collections import deque
 from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass
 import functools
 import itertools
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
-import _pytest.config
-from _pytest.fixtures import FixtureManager as PytestFixtureManager
-from _pytest.main import Session
 from mypy.checker import TypeChecker
 from mypy.nodes import MypyFile
 from mypy.types import CallableType, Instance, LiteralType, Type, UnionType
-from pytest import FixtureDef
 
 from .checker_wrapper import CheckerWrapper
 from .fixture import Fixture, FixtureScope
 from .fullname import Fullname
+from .pytest_config_manager import PytestConfigManager
 from .types_module import TYPES_MODULE
 from .utils import extract_singleton, filter_unique, strict_cast, strict_not_none
 
+if TYPE_CHECKING:
+    from pytest import FixtureDef
+
 
 @dataclass(frozen=True, slots=True)
 class FixtureManager(CheckerWrapper):
@@ -40,11 +42,7 @@ class FixtureManager(CheckerWrapper):
     @classmethod
     @functools.lru_cache
     def default_fixture_module_names(cls) -> Sequence[Fullname]:
-        config = _pytest.config.get_config()
-        config.parse(["-s", "--fixtures"])
-
-        session = Session.from_config(config)
-        fixture_manager = PytestFixtureManager(session)
+        fixture_manager = PytestConfigManager.fixture_manager()
         return tuple(
             {
                 module
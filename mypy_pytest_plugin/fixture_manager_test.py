@@ -1,13 +1,17 @@
 from collections.abc import Sequence
+import logging
 from unittest import mock
 
 from inline_snapshot import snapshot
 from mypy.nodes import Decorator, FuncDef
 from mypy.subtypes import is_same_type
+import pytest
 
+from . import pytest_config_manager
 from .fixture import Fixture
 from .fixture_manager import FixtureManager
 from .fullname import Fullname
+from .pytest_config_manager import PytestConfigManager
 from .request import Request
 from .test_utils import parse_multiple, simple_module_lookup
 from .utils import strict_cast, strict_not_none
@@ -86,6 +90,19 @@ def test_fixture_manager_default_fixture_module_names() -> None:
     )
 
 
+def test_fixture_manager_bootstraps_pytest_session_once(caplog: pytest.LogCaptureFixture) -> None:
+    PytestConfigManager.session.cache_clear()
+    PytestConfigManager.fixture_manager.cache_clear()
+    with caplog.at_level(logging.DEBUG, logger=pytest_config_manager.__name__):
+        fixture_manager = PytestConfigManager.fixture_manager()
+        assert PytestConfigManager.fixture_manager() is fixture_manager
+        assert PytestConfigManager.session() is fixture_manager.session
+    assert [record.getMessage().split(" in ")[0] for record in caplog.records] == [
+        "pytest session bootstrapped",
+        "pytest fixtures collected",
+    ]
+
+
 def _fixture_manager_resolve_fixtures_test_body(
     modules: Sequence[tuple[str, str]], expected_fixtures: dict[str, list[str]]
 ) -> None:
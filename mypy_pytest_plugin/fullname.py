@@ -1,11 +1,35 @@
 from collections.abc import Iterator
-from dataclasses import dataclass
-from typing import Self
+from typing import Any, ClassVar, Self
+from weakref import WeakValueDictionary
 
 
-@dataclass(frozen=True, slots=True)
 class Fullname:
+    __slots__ = ("__weakref__", "_hash", "_module_name", "_parts", "_str")
+
     _parts: tuple[str, ...]
+    _hash: int
+    _str: str
+    _module_name: Self | None
+
+    _interned: ClassVar[WeakValueDictionary[tuple[str, ...], Any]] = WeakValueDictionary()
+
+    def __new__(cls, parts: tuple[str, ...]) -> Self:
+        try:
+            interned: Self = cls._interned[parts]
+        except KeyError:
+            ...
+        else:
+            return interned
+        self = super().__new__(cls)
+        self._parts = parts
+        self._hash = hash(parts)
+        self._str = str.join(".", parts)
+        self._module_name = None
+        cls._interned[parts] = self
+        return self
+
+    def __reduce__(self) -> tuple[type[Self], tuple[tuple[str, ...]]]:
+        return type(self), (self._parts,)
 
     @classmethod
     def from_string(cls, fullname: str) -> Self:
@@ -14,7 +38,20 @@ class Fullname:
         return cls(())
 
     def __str__(self) -> str:
-        return str.join(".", self._parts)
+        return self._str
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(_parts={self._parts!r})"
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, type(self)):
+            return self._parts == other._parts
+        return NotImplemented
 
     def __bool__(self) -> bool:
         return bool(self._parts)
@@ -34,7 +71,9 @@ class Fullname:
 
     @property
     def module_name(self) -> Self:
-        return type(self)(self._parts[:-1])
+        if self._module_name is None:
+            self._module_name = type(self)(self._parts[:-1])
+        return self._module_name
 
     def __lt__(self, other: Self) -> bool:
         if isinstance(other, type(self)):
@@ -1,3 +1,5 @@
+import pickle
+
 from .fullname import Fullname
 
 
@@ -34,3 +36,16 @@ def test_fullname_push_back_multiple() -> None:
     assert Fullname(("root", "folder_name", "test_file")).push_back("conftest") == Fullname(
         ("root", "folder_name", "test_file", "conftest")
     )
+
+
+def test_fullname_interned() -> None:
+    fullname = Fullname.from_string("root.folder_name.test_file")
+    assert fullname is Fullname(("root", "folder_name", "test_file"))
+    assert fullname.module_name is Fullname.from_string("root.folder_name")
+    assert fullname.module_name is fullname.module_name
+    assert Fullname(()).push_back("root").push_back("folder_name") is fullname.module_name
+
+
+def test_fullname_pickle_round_trip() -> None:
+    fullname = Fullname.from_string("root.test_file")
+    assert pickle.loads(pickle.dumps(fullname)) is fullname
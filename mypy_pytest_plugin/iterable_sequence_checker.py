@@ -1,38 +1,72 @@
 from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 import sys
+from typing import ClassVar
 
-from mypy.argmap import map_formals_to_actuals
 from mypy.checker import TypeChecker
 from mypy.messages import format_type
-from mypy.nodes import ArgKind, CallExpr, Context, Expression
+from mypy.nodes import ArgKind, CallExpr, Context, Expression, TypeInfo
 from mypy.subtypes import is_subtype
 from mypy.types import CallableType, Instance, Type
 
+from .argmapper import ArgMapper
 from .checker_wrapper import CheckerWrapper
 from .error_codes import ITERABLE_SEQUENCE
+from .utils import ScopedCache
 
 
 @dataclass(frozen=True, slots=True)
 class IterableSequenceChecker(CheckerWrapper):
     checker: TypeChecker
 
-    def check_iterable_sequence_call(self, call: CallExpr) -> None:
-        if not self.is_builtin_function(call.callee):
-            self.check_iterable_sequence_arguments(call)
+    CACHE_SIZE: ClassVar[int] = 2**12
+    _iterable_formals_cache: ClassVar[
+        ScopedCache[tuple[str | None, CallableType], frozenset[int]]
+    ] = ScopedCache(CACHE_SIZE)
+    _sequence_type_cache: ClassVar[ScopedCache[str, Instance]] = ScopedCache(maxsize=1)
+    _sequence_info_cache: ClassVar[ScopedCache[TypeInfo, bool]] = ScopedCache()
 
-    def is_builtin_function(self, expression: Expression) -> bool:
-        expression_type = self.checker.lookup_type(expression)
-        if (
-            isinstance(expression_type, CallableType)
-            and (def_ := expression_type.definition) is not None
+    def check_iterable_sequence_call(self, call: CallExpr) -> None:
+        callee_type = self.checker.lookup_type(call.callee)
+        if isinstance(callee_type, CallableType) and (
+            iterable_formals := self.iterable_formals(callee_type)
         ):
-            [module, *_] = def_.fullname.split(".", maxsplit=1) if def_ else [""]
-            return module in sys.stdlib_module_names
+            self.check_iterable_sequence_arguments(call, callee_type, iterable_formals)
+
+    def iterable_formals(self, callee_type: CallableType) -> frozenset[int]:
+        definition = callee_type.definition
+        return self._iterable_formals_cache.get(
+            self.checker.modules,
+            (definition.fullname if definition is not None else None, callee_type),
+            lambda: self._find_iterable_formals(callee_type),
+        )
+
+    def _find_iterable_formals(self, callee_type: CallableType) -> frozenset[int]:
+        if self._is_stdlib_callable(callee_type):
+            return frozenset()
+        return frozenset(
+            formal_idx
+            for formal_idx, formal_type in enumerate(callee_type.arg_types)
+            if self.is_iterable(formal_type)
+        )
+
+    @classmethod
+    def _is_stdlib_callable(cls, callable_type: CallableType) -> bool:
+        if (def_ := callable_type.definition) is not None:
+            return cls._is_stdlib_name(def_.fullname)
         return False
 
-    def check_iterable_sequence_arguments(self, call: CallExpr) -> None:
-        for argument, expected_type in self.actuals_formals_mapping_bijective_subset(call):
+    @classmethod
+    def _is_stdlib_name(cls, fullname: str) -> bool:
+        [module, *_] = fullname.split(".", maxsplit=1)
+        return module in sys.stdlib_module_names
+
+    def check_iterable_sequence_arguments(
+        self, call: CallExpr, callee_type: CallableType, iterable_formals: Collection[int]
+    ) -> None:
+        for argument, expected_type in self.actuals_formals_mapping_bijective_subset(
+            call, callee_type, iterable_formals
+        ):
             self.check_iterable_sequence_argument(argument, expected_type)
 
     def check_iterable_sequence_argument(self, argument: Expression, expected_type: Type) -> None:
@@ -59,24 +93,15 @@ class IterableSequenceChecker(CheckerWrapper):
         )
 
     def actuals_formals_mapping_bijective_subset(
-        self, call: CallExpr
+        self, call: CallExpr, callee_type: CallableType, formals: Collection[int]
     ) -> Sequence[tuple[Expression, Type]]:
-        callee_type = self.checker.lookup_type(call.callee)
-        if not isinstance(callee_type, CallableType):
-            return []
-
-        mapping = map_formals_to_actuals(
-            actual_kinds=call.arg_kinds,
-            actual_names=call.arg_names,
-            formal_kinds=callee_type.arg_kinds,
-            formal_names=callee_type.arg_names,
-            actual_arg_type=lambda i: call.args[i].accept(self.checker.expr_checker),
-        )
-
+        mapping = ArgMapper.actuals_to_formals(call, callee_type, self.checker)
         return [
             (call.args[actual_idx], callee_type.arg_types[formal_idxs[0]])
             for actual_idx, formal_idxs in enumerate(mapping)
-            if call.arg_kinds[actual_idx] in self.accepted_arg_kinds and len(formal_idxs) == 1
+            if call.arg_kinds[actual_idx] in self.accepted_arg_kinds
+            and len(formal_idxs) == 1
+            and formal_idxs[0] in formals
         ]
 
     @property
@@ -87,4 +112,17 @@ class IterableSequenceChecker(CheckerWrapper):
         return isinstance(type_, Instance) and type_.type.fullname == "typing.Iterable"
 
     def is_sequence(self, type_: Type) -> bool:
-        return is_subtype(type_, self.checker.named_type("typing.Sequence"))
+        if isinstance(type_, Instance) and self._is_stdlib_name(type_.type.fullname):
+            return self._sequence_info_cache.get(
+                self.checker.modules,
+                type_.type,
+                lambda: is_subtype(type_, self._sequence_type()),
+            )
+        return is_subtype(type_, self._sequence_type())
+
+    def _sequence_type(self) -> Instance:
+        return self._sequence_type_cache.get(
+            self.checker.modules,
+            "typing.Sequence",
+            lambda: self.checker.named_type("typing.Sequence"),
+        )
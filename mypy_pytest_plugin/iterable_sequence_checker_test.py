@@ -1,5 +1,11 @@
+from unittest import mock
+
 from mypy.nodes import CallExpr
+from mypy.subtypes import is_subtype
+from mypy.types import CallableType
+import pytest
 
+from .argmapper import ArgMapper
 from .iterable_sequence_checker import IterableSequenceChecker
 from .test_utils import check_error_messages, get_error_messages, parse
 
@@ -184,3 +190,107 @@ def test_check_iterable_sequence_stdlib() -> None:
         call = itertools.pairwise([1, 2, 3])
         """
     )
+
+
+@pytest.mark.parametrize(
+    "defs, expected",
+    [
+        (
+            """
+            def foo(x: int, y: str) -> int:
+                return 0
+
+            call = foo(1, "")
+            """,
+            frozenset(),
+        ),
+        (
+            """
+            from typing import Iterable, Sequence
+
+            def foo(x: Iterable[int], y: Sequence[int], *, z: Iterable[str]) -> int:
+                return 0
+
+            call = foo([], [], z=[])
+            """,
+            frozenset({0, 2}),
+        ),
+        (
+            """
+            import itertools
+
+            call = itertools.pairwise([1])
+            """,
+            frozenset(),
+        ),
+    ],
+)
+def test_iterable_formals(defs: str, expected: frozenset[int]) -> None:
+    parse_result = parse(defs)
+    call = parse_result.defs["call"]
+    assert isinstance(call, CallExpr)
+    parse_result.accept_all()
+    callee_type = parse_result.checker.lookup_type(call.callee)
+    assert isinstance(callee_type, CallableType)
+    assert IterableSequenceChecker(parse_result.checker).iterable_formals(callee_type) == expected
+
+
+def test_check_iterable_sequence_call_skips_callee_without_iterable_formals() -> None:
+    parse_result = parse(
+        """
+        def foo(x: int) -> int:
+            return 0
+
+        call = foo(1)
+        """
+    )
+    call = parse_result.defs["call"]
+    assert isinstance(call, CallExpr)
+    parse_result.accept_all()
+
+    with mock.patch.object(ArgMapper, "actuals_to_formals", autospec=True) as actuals_to_formals:
+        IterableSequenceChecker(parse_result.checker).check_iterable_sequence_call(call)
+
+    actuals_to_formals.assert_not_called()
+
+
+def test_is_sequence_checks_subtype_once_per_type_info() -> None:
+    parse_result = parse(
+        """
+        ints: list[int]
+        strs: list[str]
+        more_ints: list[int]
+        mapping: dict[str, int]
+        """
+    )
+    checker = IterableSequenceChecker(parse_result.checker)
+    verdicts = {}
+    with mock.patch(
+        f"{IterableSequenceChecker.__module__}.is_subtype", wraps=is_subtype
+    ) as is_subtype_mock:
+        for name in ("ints", "strs", "more_ints", "mapping", "mapping"):
+            type_ = parse_result.types[name]
+            assert type_ is not None
+            verdicts[name] = checker.is_sequence(type_)
+    assert verdicts == {"ints": True, "strs": True, "more_ints": True, "mapping": False}
+    checked_types = [str(call.args[0]) for call in is_subtype_mock.call_args_list]
+    assert checked_types == ["list[int]", "dict[str, int]"]
+
+
+def test_is_sequence_rechecks_user_defined_type_info() -> None:
+    parse_result = parse(
+        """
+        class Numbers(list[int]): ...
+
+        numbers: Numbers
+        """
+    )
+    checker = IterableSequenceChecker(parse_result.checker)
+    type_ = parse_result.types["numbers"]
+    assert type_ is not None
+    with mock.patch(
+        f"{IterableSequenceChecker.__module__}.is_subtype", wraps=is_subtype
+    ) as is_subtype_mock:
+        assert checker.is_sequence(type_)
+        assert checker.is_sequence(type_)
+    assert is_subtype_mock.call_count == 2
@@ -1,25 +1,55 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 import functools
 import itertools
+from typing import ClassVar, Self
 
 from mypy.checker import TypeChecker
-from mypy.nodes import MemberExpr
+from mypy.nodes import GDEF, MemberExpr, RefExpr, TypeInfo
 from mypy.subtypes import is_same_type
 
 from .checker_wrapper import CheckerWrapper
 from .error_codes import UNKNOWN_MARK
 from .pytest_config_manager import PytestConfigManager
+from .utils import ScopedCache
+
+
+@dataclass(frozen=True, slots=True)
+class MarkNames:
+    predefined: Sequence[str]
+    user_defined: Sequence[str]
+    index: frozenset[str]
+
+    @classmethod
+    def from_mark_generator(cls, mark_generator: TypeInfo, markers: Iterable[str]) -> Self:
+        predefined = [name for name in mark_generator.names if not name.startswith("_")]
+        user_defined = [
+            name
+            for line in markers
+            if (name := line.split(":")[0].split("(")[0].strip()) and not name.startswith("_")
+        ]
+        return cls(predefined, user_defined, frozenset(itertools.chain(predefined, user_defined)))
 
 
 @dataclass(frozen=True)
 class MarkChecker(CheckerWrapper):
     checker: TypeChecker
 
+    _mark_names_cache: ClassVar[ScopedCache[TypeInfo, MarkNames]] = ScopedCache(maxsize=1)
+    _validated_marks: ClassVar[ScopedCache[tuple[str, str], bool]] = ScopedCache()
+
     def check_attribute(self, expr: MemberExpr) -> None:
-        if is_same_type(
+        key = self._validated_mark_key(expr)
+        if key is not None and self._validated_marks.lookup(self.checker.tree, key):
+            return
+        if not is_same_type(
             self.checker.lookup_type(expr.expr), self.checker.named_type("pytest.MarkGenerator")
-        ) and not self.is_valid_mark(expr.name):
+        ):
+            return
+        if self.is_valid_mark(expr.name):
+            if key is not None:
+                self._validated_marks.put(self.checker.tree, key, True)
+        else:
             error_msg = f"Invalid mark name {expr.name!r}."
             note_prefix = f"Expected a predefined mark (one of {self.predefined_names!r}) or "
             if self.user_defined_names:
@@ -29,25 +59,28 @@ class MarkChecker(CheckerWrapper):
             self.fail(error_msg, context=expr, code=UNKNOWN_MARK)
             self.note(note_prefix + note_suffix, context=expr, code=UNKNOWN_MARK)
 
-    def is_valid_mark(self, name: str) -> bool:
-        return not name.startswith("_") and (name in self._mark_names_index)
+    @classmethod
+    def _validated_mark_key(cls, expr: MemberExpr) -> tuple[str, str] | None:
+        if isinstance(expr.expr, RefExpr) and expr.expr.kind == GDEF and expr.expr.fullname:
+            return expr.expr.fullname, expr.name
+        return None
 
-    @functools.cached_property
-    def _mark_names_index(self) -> set[str]:
-        return set(itertools.chain(self.predefined_names, self.user_defined_names))
+    def is_valid_mark(self, name: str) -> bool:
+        return not name.startswith("_") and (name in self._mark_names.index)
 
-    @functools.cached_property
+    @property
     def predefined_names(self) -> Sequence[str]:
-        return [
-            name
-            for name in self.checker.named_type("pytest.MarkGenerator").type.names
-            if not name.startswith("_")
-        ]
+        return self._mark_names.predefined
+
+    @property
+    def user_defined_names(self) -> Sequence[str]:
+        return self._mark_names.user_defined
 
     @functools.cached_property
-    def user_defined_names(self) -> list[str]:
-        return [
-            name
-            for line in PytestConfigManager.markers()
-            if (name := line.split(":")[0].split("(")[0].strip()) and not name.startswith("_")
-        ]
+    def _mark_names(self) -> MarkNames:
+        mark_generator = self.checker.named_type("pytest.MarkGenerator").type
+        return self._mark_names_cache.get(
+            PytestConfigManager.fingerprint(),
+            mark_generator,
+            lambda: MarkNames.from_mark_generator(mark_generator, PytestConfigManager.markers()),
+        )
@@ -1,19 +1,27 @@
+from pathlib import Path
+from unittest import mock
+
+from mypy.nodes import MemberExpr
+import pytest
+
 from .mark_checker import MarkChecker
-from .test_utils import parse
+from .pytest_config_manager import PytestConfigManager
+from .test_utils import get_error_messages, parse
+
+PYTEST_SOURCE_MOCK = """
+from typing import Any
+
+class MarkGenerator:
+    skip: Any
+    parametrize: Any
+    def __getattr__(self, name: str) -> Any:
+        raise NotImplementedError()
+    def _config(self) -> None: ...
+"""
 
 
 def _mark_name_test_body(name: str, valid: bool) -> None:
-    pytest_source_mock = """
-    from typing import Any
-
-    class MarkGenerator:
-        skip: Any
-        parametrize: Any
-        def __getattr__(self, name: str) -> Any:
-            raise NotImplementedError()
-        def _config(self) -> None: ...
-    """
-    parse_result = parse(pytest_source_mock, module_name="pytest")
+    parse_result = parse(PYTEST_SOURCE_MOCK, module_name="pytest")
     parse_result.accept_all()
 
     mark_checker = MarkChecker(parse_result.checker)
@@ -34,3 +42,60 @@ def test_mark_name_not_predefined() -> None:
 
 def test_mark_name_user_defined() -> None:
     _mark_name_test_body("used_for_testing", True)
+
+
+def test_mark_names_shared_between_checkers() -> None:
+    parse_result = parse(PYTEST_SOURCE_MOCK, module_name="pytest")
+    parse_result.accept_all()
+
+    first = MarkChecker(parse_result.checker)
+    second = MarkChecker(parse_result.checker)
+    assert first.predefined_names is second.predefined_names
+    assert first.predefined_names == ["skip", "parametrize"]
+    assert first.user_defined_names == ["used_for_testing"]
+
+
+def test_mark_names_follow_config_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(PytestConfigManager, "REFRESH_INTERVAL", 0.0)
+    monkeypatch.setattr(PytestConfigManager, "_fingerprint", None)
+    parse_result = parse(PYTEST_SOURCE_MOCK, module_name="pytest")
+    parse_result.accept_all()
+
+    config = tmp_path / "pytest.ini"
+    config.write_text("[pytest]\nmarkers =\n    slow: slow tests\n")
+    assert MarkChecker(parse_result.checker).user_defined_names == ["slow"]
+    config.write_text("[pytest]\nmarkers =\n    fast: fast tests\n    network\n")
+    mark_checker = MarkChecker(parse_result.checker)
+    assert mark_checker.user_defined_names == ["fast", "network"]
+    assert not mark_checker.is_valid_mark("slow")
+
+
+def _check_attributes_test_body(names: list[str], *, validations: int, errors: int) -> None:
+    source = "\n".join(
+        ["import pytest", *(f"{name}_{i} = pytest.mark.{name}" for i, name in enumerate(names))]
+    )
+    parse_result = parse(source)
+    parse_result.accept_all()
+    checker = parse_result.checker
+
+    with mock.patch.object(
+        MarkChecker, "is_valid_mark", autospec=True, side_effect=MarkChecker.is_valid_mark
+    ) as is_valid_mark:
+        for i, name in enumerate(names):
+            expr = parse_result.defs[f"{name}_{i}"]
+            assert isinstance(expr, MemberExpr)
+            MarkChecker(checker).check_attribute(expr)
+
+    assert is_valid_mark.call_count == validations
+    assert get_error_messages(checker).count("[unknown-mark]") == errors
+
+
+def test_check_attribute_skips_validated_marks() -> None:
+    _check_attributes_test_body(
+        ["parametrize", "parametrize", "skip", "parametrize"], validations=2, errors=0
+    )
+
+
+def test_check_attribute_reports_every_invalid_mark() -> None:
+    _check_attributes_test_body(["invalid", "invalid"], validations=2, errors=2)
@@ -1,9 +1,10 @@
 import abc
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
-import re
+from typing import ClassVar
 
 from mypy.checker import TypeChecker
-from mypy.nodes import CallExpr, Expression, SymbolTableNode, TypeInfo
+from mypy.nodes import CallExpr, Expression, MypyFile, SymbolTableNode, TypeInfo
 from mypy.plugin import FunctionContext, MethodContext
 from mypy.typeops import bind_self, type_object_type
 from mypy.types import FunctionLike, Instance, Type
@@ -11,12 +12,15 @@ from mypy.types import FunctionLike, Instance, Type
 from .object_patch_call_checker import ObjectPatchCallChecker
 from .patch_call_checker import PatchCallChecker
 from .types_module import TYPES_MODULE
+from .utils import ScopedCache
 
 
 @dataclass(frozen=True, slots=True)
 class MockCallChecker[T: MethodContext | FunctionContext](abc.ABC):
     checker: TypeChecker
 
+    _stub_overrides_cache: ClassVar[ScopedCache[MypyFile, Mapping[str, Type]]] = ScopedCache()
+
     @classmethod
     def check_mock_calls(cls, ctx: T, *, fullname: str) -> Type:
         if isinstance(ctx.api, TypeChecker) and isinstance(ctx.context, CallExpr):
@@ -33,6 +37,27 @@ class MockCallChecker[T: MethodContext | FunctionContext](abc.ABC):
             return ObjectPatchCallChecker(self.checker).add_patch_generics(call)
         return self.inject_mock_stub(call.callee, fullname)
 
+    def _stub_overrides(self) -> Mapping[str, Type]:
+        if (stub := self.checker.modules.get(f"{TYPES_MODULE}.mock")) is None:
+            return {}
+        return self._stub_overrides_cache.get(
+            self.checker.modules, stub, lambda: dict(self._stub_override_types(stub))
+        )
+
+    def _stub_override_types(self, stub: MypyFile) -> Iterator[tuple[str, Type]]:
+        for name, symbol_table_node in stub.names.items():
+            if symbol_table_node.fullname != f"{stub.fullname}.{name}":
+                continue
+            if (type_ := self._get_type_from_symbol_table(symbol_table_node)) is not None:
+                yield f"unittest.mock.{name}", type_
+            if isinstance(type_info := symbol_table_node.node, TypeInfo):
+                for member, member_node in type_info.names.items():
+                    if (
+                        member_node.fullname == f"{type_info.fullname}.{member}"
+                        and member_node.type is not None
+                    ):
+                        yield f"unittest.mock.{name}.{member}", member_node.type
+
     def check_call(self, call: CallExpr, callee_type: Type) -> Type:
         result_type, _inferred_type = self.checker.expr_checker.check_call(
             callee=callee_type,
@@ -44,12 +69,8 @@ class MockCallChecker[T: MethodContext | FunctionContext](abc.ABC):
         return result_type
 
     def inject_mock_stub(self, callee: Expression, fullname: str) -> Type | None:
-        fullname = re.sub(r"^unittest", TYPES_MODULE, fullname, count=1)
-        if (
-            symbol_table_node := self._lookup_symbol_table_node(fullname)
-        ) is None or symbol_table_node.fullname != fullname:
+        if (callee_type := self._stub_overrides().get(fullname)) is None:
             return None
-        callee_type = self._get_type_from_symbol_table(symbol_table_node)
 
         original_callee_type = self.checker.lookup_type(callee)
         if isinstance(original_callee_type, Instance) and isinstance(callee_type, FunctionLike):
@@ -63,26 +84,10 @@ class MockCallChecker[T: MethodContext | FunctionContext](abc.ABC):
             return type_object_type(type_info, self.checker.named_type)
         return node.type
 
-    @abc.abstractmethod
-    def _lookup_symbol_table_node(self, fullname: str) -> SymbolTableNode | None: ...
-
 
 @dataclass(frozen=True, slots=True)
-class FunctionMockCallChecker(MockCallChecker[FunctionContext]):
-    def _lookup_symbol_table_node(self, fullname: str) -> SymbolTableNode | None:
-        try:
-            return self.checker.lookup_qualified(fullname)
-        except KeyError:
-            return None
+class FunctionMockCallChecker(MockCallChecker[FunctionContext]): ...
 
 
 @dataclass(frozen=True, slots=True)
-class MethodMockCallChecker(MockCallChecker[MethodContext]):
-    def _lookup_symbol_table_node(self, fullname: str) -> SymbolTableNode | None:
-        class_fullname, name = fullname.rsplit(".", maxsplit=1)
-        try:
-            class_symbol_table_node = self.checker.lookup_qualified(class_fullname)
-            assert isinstance(class_symbol_table_node.node, TypeInfo)
-            return class_symbol_table_node.node.names[name]
-        except KeyError:
-            return None
+class MethodMockCallChecker(MockCallChecker[MethodContext]): ...
@@ -0,0 +1,62 @@
+from mypy.nodes import Expression, TypeInfo
+from mypy.subtypes import is_same_type
+from mypy.typeops import type_object_type
+import pytest
+
+from .mock_call_checker import FunctionMockCallChecker
+from .test_utils import parse
+from .types_module import TYPES_MODULE
+
+
+@pytest.mark.parametrize(
+    "fullname, expected",
+    [
+        ("unittest.mock.Mock", True),
+        ("unittest.mock.patch", True),
+        ("unittest.mock.NonCallableMock.assert_called_with", True),
+        ("unittest.mock.Mock.assert_called_with", False),
+        ("unittest.mock._Call", False),
+        ("unittest.mock.sentinel", False),
+    ],
+)
+def test_stub_overrides(fullname: str, expected: bool) -> None:
+    parse_result = parse("import mypy_pytest_plugin_types.mock")
+    assert (fullname in FunctionMockCallChecker(parse_result.checker)._stub_overrides()) == expected
+
+
+def test_inject_mock_stub() -> None:
+    parse_result = parse(
+        """
+        import mypy_pytest_plugin_types.mock
+        from unittest.mock import Mock, NonCallableMock
+
+        mock_class = Mock
+        mock_method = NonCallableMock().assert_called_with
+        mock_value = NonCallableMock().return_value
+        """
+    )
+    parse_result.accept_all()
+    checker = parse_result.checker
+    mock_call_checker = FunctionMockCallChecker(checker)
+    stub = checker.modules[f"{TYPES_MODULE}.mock"]
+    mock_class, mock_method, mock_value = (
+        parse_result.defs[name] for name in ("mock_class", "mock_method", "mock_value")
+    )
+    assert isinstance(mock_class, Expression)
+    assert isinstance(mock_method, Expression)
+    assert isinstance(mock_value, Expression)
+
+    stub_info = stub.names["Mock"].node
+    assert isinstance(stub_info, TypeInfo)
+    class_type = mock_call_checker.inject_mock_stub(mock_class, "unittest.mock.Mock")
+    assert class_type is not None
+    assert is_same_type(class_type, type_object_type(stub_info, checker.named_type))
+
+    stub_info = stub.names["NonCallableMock"].node
+    assert isinstance(stub_info, TypeInfo)
+    method_type = mock_call_checker.inject_mock_stub(
+        mock_method, "unittest.mock.NonCallableMock.assert_called_with"
+    )
+    assert method_type is stub_info.names["assert_called_with"].type
+
+    assert mock_call_checker.inject_mock_stub(mock_value, "unittest.mock._Call") is None
@@ -1,34 +1,101 @@
+from collections.abc import Collection
 from dataclasses import dataclass
+from typing import ClassVar
 
 from mypy.checker import TypeChecker
-from mypy.nodes import CallExpr, Context, Expression, MemberExpr
-from mypy.types import AnyType, Type
+from mypy.nodes import CallExpr, Context, Expression, MemberExpr, SymbolNode, TypeInfo
+from mypy.types import AnyType, CallableType, Instance, Type, TypeType, get_proper_type
 
-from .argmapper import ArgMapper
 from .patch_call_checker import PatchCallChecker
+from .utils import ScopedCache
 
 
 @dataclass(frozen=True, slots=True)
 class ObjectPatchCallChecker(PatchCallChecker):
     checker: TypeChecker
+    PATCH_ARGNAMES: ClassVar[Collection[str]] = ("target", "attribute")
+
+    _attribute_patcher_cache: ClassVar[
+        ScopedCache[tuple[Type, str], tuple[object, object, Type | None]]
+    ] = ScopedCache(PatchCallChecker.CACHE_SIZE)
 
     def add_patch_generics(self, call: CallExpr) -> Type | None:
+        patch_args = self._patch_args(call)
         if (
-            (target_arg := self._target_arg(call)) is not None
-            and (attribute_arg := self._attribute_arg(call)) is not None
+            (target_arg := patch_args.get("target")) is not None
+            and (attribute_arg := patch_args.get("attribute")) is not None
             and (attribute_value := self._string_value(attribute_arg)) is not None
-            and (
-                original_type := self._attribute_type(
-                    target_arg, attribute_value, context=attribute_arg
-                )
-            )
+        ):
+            return self._attribute_patcher_type(target_arg, attribute_value, context=attribute_arg)
+        return None
+
+    def _attribute_patcher_type(
+        self, base: Expression, attribute: str, *, context: Context
+    ) -> Type | None:
+        key = self._attribute_cache_key(base, attribute)
+        member = self._attribute_member(base, attribute)
+        signature = self._node_signature(member)
+        if (
+            key is not None
+            and member is not None
+            and (cached := self._attribute_patcher_cache.lookup(self.checker.modules, key))
             is not None
+            and cached[0] is member
+            and cached[1] is signature
         ):
-            return self._specialized_patcher_type(original_type, attribute="object")
+            _member, _signature, patcher_type = cached
+            return patcher_type
+        if (property_type := self._attribute_property_type(base, attribute)) is not None:
+            patcher_type = self._specialized_patcher_type(
+                property_type, attribute="object", is_property=True
+            )
+        elif (original_type := self._attribute_type(base, attribute, context=context)) is not None:
+            patcher_type = self._specialized_patcher_type(original_type, attribute="object")
+        else:
+            return None
+        if key is not None and member is not None and patcher_type is not None:
+            self._attribute_patcher_cache.put(
+                self.checker.modules, key, (member, signature, patcher_type)
+            )
+        return patcher_type
+
+    def _attribute_cache_key(self, base: Expression, attribute: str) -> tuple[Type, str] | None:
+        base_type = get_proper_type(self.checker.lookup_type_or_none(base))
+        if isinstance(base_type, Instance | TypeType) or (
+            isinstance(base_type, CallableType) and base_type.is_type_obj()
+        ):
+            return base_type, attribute
+        return None
+
+    def _attribute_member(self, base: Expression, attribute: str) -> SymbolNode | None:
+        match get_proper_type(self.checker.lookup_type_or_none(base)):
+            case Instance(type=type_info) | TypeType(item=Instance(type=type_info)):
+                pass
+            case CallableType() as callable_type if callable_type.is_type_obj():
+                type_info = callable_type.type_object()
+            case _:
+                return None
+        if (symbol_table_node := type_info.get(attribute)) is None:
+            return None
+        return symbol_table_node.node
+
+    def _attribute_property_type(self, base: Expression, attribute: str) -> Type | None:
+        if (type_info := self._base_class_info(base)) is None or (
+            symbol_table_node := type_info.get(attribute)
+        ) is None:
+            return None
+        return self._property_type(symbol_table_node.node)
+
+    def _base_class_info(self, base: Expression) -> TypeInfo | None:
+        match get_proper_type(self.checker.lookup_type_or_none(base)):
+            case TypeType(item=Instance(type=type_info)):
+                return type_info
+            case CallableType() as callable_type if callable_type.is_type_obj():
+                return callable_type.type_object()
         return None
 
     def _attribute_arg(self, call: CallExpr) -> Expression | None:
-        return ArgMapper.named_arg_mapping(call, self.checker).get("attribute")
+        return self._patch_args(call).get("attribute")
 
     def _attribute_type(self, base: Expression, attribute: str, *, context: Context) -> Type | None:
         member = MemberExpr(base, name=attribute)
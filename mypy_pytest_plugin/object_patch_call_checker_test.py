@@ -1,5 +1,8 @@
-from mypy.nodes import CallExpr, Expression
+from unittest import mock
+
+from mypy.nodes import MDEF, CallExpr, Expression, FuncDef, SymbolTableNode, TypeInfo, Var
 from mypy.subtypes import is_same_type
+from mypy.types import CallableType
 
 from .object_patch_call_checker import ObjectPatchCallChecker
 from .test_utils import check_error_messages, dump_expr, get_error_messages, parse
@@ -166,3 +169,99 @@ def test_attribute_type_union() -> None:
         """,
         "x",
     )
+
+
+def test_add_patch_generics_reuses_attribute_patcher_type() -> None:
+    parse_result = parse(
+        """
+        import mypy_pytest_plugin_types.mock
+        from unittest import mock
+
+        class Foo:
+            def bar(self, x: int) -> int:
+                return x
+
+        first = mock.patch.object(Foo, "bar")
+        second = mock.patch.object(Foo, "bar")
+        instance = mock.patch.object(Foo(), "bar")
+        """
+    )
+    parse_result.accept_all()
+    with mock.patch.object(
+        ObjectPatchCallChecker,
+        "_attribute_type",
+        autospec=True,
+        side_effect=ObjectPatchCallChecker._attribute_type,
+    ) as attribute_type:
+        patcher_types = []
+        for name in ("first", "second", "instance"):
+            call = parse_result.defs[name]
+            assert isinstance(call, CallExpr)
+            patcher_types.append(
+                ObjectPatchCallChecker(parse_result.checker).add_patch_generics(call)
+            )
+    assert attribute_type.call_count == 2
+    [first, second, instance] = patcher_types
+    assert first is not None
+    assert first is second
+    assert instance is not None
+    assert str(instance) != str(first)
+
+
+def test_add_patch_generics_rechecked_attribute() -> None:
+    parse_result = parse(
+        """
+        import mypy_pytest_plugin_types.mock
+        from unittest import mock
+
+        class Foo:
+            def bar(self, x: int) -> int:
+                return x
+
+        call = mock.patch.object(Foo, "bar")
+        """
+    )
+    parse_result.accept_all()
+    call = parse_result.defs["call"]
+    assert isinstance(call, CallExpr)
+    object_patch_call_checker = ObjectPatchCallChecker(parse_result.checker)
+    first = object_patch_call_checker.add_patch_generics(call)
+
+    foo = parse_result.checker.tree.names["Foo"].node
+    assert isinstance(foo, TypeInfo)
+    bar = foo.names["bar"].node
+    assert isinstance(bar, FuncDef)
+    assert isinstance(bar.type, CallableType)
+    bar.type = bar.type.copy_modified(ret_type=parse_result.checker.named_type("builtins.str"))
+    second = object_patch_call_checker.add_patch_generics(call)
+    assert str(first) != str(second)
+    assert "Mock[[self: test_module.Foo, x: int], str]" in str(second)
+
+
+def test_add_patch_generics_rechecked_property() -> None:
+    parse_result = parse(
+        """
+        import mypy_pytest_plugin_types.mock
+        from unittest import mock
+
+        class Foo:
+            @property
+            def value(self) -> int:
+                return 0
+
+        call = mock.patch.object(Foo, "value")
+        """
+    )
+    parse_result.accept_all()
+    checker = parse_result.checker
+    call = parse_result.defs["call"]
+    assert isinstance(call, CallExpr)
+    object_patch_call_checker = ObjectPatchCallChecker(checker)
+    assert "PropertyMock" in str(object_patch_call_checker.add_patch_generics(call))
+
+    foo = checker.tree.names["Foo"].node
+    assert isinstance(foo, TypeInfo)
+    value = Var("value", checker.named_type("builtins.int"))
+    value.info = foo
+    foo.names["value"] = SymbolTableNode(MDEF, value)
+    assert "PropertyMock" not in str(object_patch_call_checker.add_patch_generics(call))
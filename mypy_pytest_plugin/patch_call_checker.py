@@ -1,35 +1,95 @@
+from collections.abc import Collection
 from dataclasses import dataclass
+from typing import ClassVar
 
 from mypy.checker import TypeChecker
 from mypy.expandtype import expand_type_by_instance
-from mypy.nodes import CallExpr, Expression, StrExpr
-from mypy.types import CallableType, Instance, LiteralType, Overloaded, Parameters, Type
+from mypy.nodes import CallExpr, Context, Decorator, Expression, FuncDef, OverloadedFuncDef, StrExpr
+from mypy.types import (
+    CallableType,
+    Instance,
+    LiteralType,
+    Overloaded,
+    Parameters,
+    Type,
+    get_proper_type,
+)
 
-from .argmapper import ArgMapper
+from .argmapper import ArgMap, ArgMapper
 from .checker_wrapper import CheckerWrapper
 from .fullname import Fullname
 from .types_module import TYPES_MODULE
+from .utils import ScopedCache
 
 
 @dataclass(frozen=True, slots=True)
 class PatchCallChecker(CheckerWrapper):
     checker: TypeChecker
+    PATCH_ARGNAMES: ClassVar[Collection[str]] = ("target",)
+
+    CACHE_SIZE: ClassVar[int] = 2**12
+    _target_patcher_cache: ClassVar[ScopedCache[str, tuple[object, object, Type | None]]] = (
+        ScopedCache(CACHE_SIZE)
+    )
 
     def add_patch_generics(self, call: CallExpr) -> Type | None:
-        if (
-            (target_arg := self._target_arg(call)) is not None
-            and (arg_value := self._string_value(target_arg)) is not None
-            and (
-                original_type := self.lookup_fullname_type(
-                    Fullname.from_string(arg_value), context=target_arg
-                )
-            )
-        ):
-            return self._specialized_patcher_type(original_type)
+        if (target_arg := self._target_arg(call)) is not None and (
+            arg_value := self._string_value(target_arg)
+        ) is not None:
+            return self._target_patcher_type(arg_value, context=target_arg)
+        return None
+
+    def _target_patcher_type(self, target: str, *, context: Context) -> Type | None:
+        result = self.lookup_fullname(
+            Fullname.from_string(target), context=context, predicate=self._has_type
+        )
+        if result is None:
+            return None
+        _module, node = result
+        signature = self._node_signature(node)
+        cached = self._target_patcher_cache.lookup(self.checker.modules, target)
+        if cached is not None and cached[0] is node and cached[1] is signature:
+            _node, _signature, patcher_type = cached
+            return patcher_type
+        if (property_type := self._property_type(node)) is not None:
+            patcher_type = self._specialized_patcher_type(property_type, is_property=True)
+        elif node.type is not None:
+            patcher_type = self._specialized_patcher_type(node.type)
+        else:
+            return None
+        self._target_patcher_cache.put(
+            self.checker.modules, target, (node, signature, patcher_type)
+        )
+        return patcher_type
+
+    @classmethod
+    def _node_signature(cls, node: object) -> object:
+        match node:
+            case Decorator(func=FuncDef(type=type_)):
+                return type_
+        return getattr(node, "type", None)
+
+    @classmethod
+    def _has_type(cls, node: object) -> bool:
+        return hasattr(node, "type")
+
+    @classmethod
+    def _property_type(cls, node: object) -> Type | None:
+        match node:
+            case Decorator(func=FuncDef(is_property=True, type=CallableType() as getter_type)):
+                return getter_type.ret_type
+            case OverloadedFuncDef(
+                is_property=True,
+                items=[Decorator(func=FuncDef(type=CallableType() as getter_type)), *_],
+            ):
+                return getter_type.ret_type
         return None
 
     def _target_arg(self, call: CallExpr) -> Expression | None:
-        return ArgMapper.named_arg_mapping(call, self.checker).get("target")
+        return self._patch_args(call).get("target")
+
+    def _patch_args(self, call: CallExpr) -> ArgMap:
+        return ArgMapper.named_arg_mapping(call, self.checker, names=self.PATCH_ARGNAMES)
 
     def _string_value(self, expression: Expression) -> str | None:
         if isinstance(expression, StrExpr):
@@ -41,13 +101,13 @@ class PatchCallChecker(CheckerWrapper):
         return None
 
     def _specialized_patcher_type(
-        self, original_type: Type, *, attribute: str | None = None
+        self, original_type: Type, *, attribute: str | None = None, is_property: bool = False
     ) -> Type | None:
-        if (mock_bounds := self._mock_bounds(original_type)) is None:
+        if f"{TYPES_MODULE}.mock" not in self.checker.modules:
             return None
-        instance_type = self.checker.named_generic_type(
-            f"{TYPES_MODULE}.mock._patcher", list(mock_bounds)
-        )
+        if (mock_bounds := self._mock_bounds(original_type, is_property=is_property)) is None:
+            return None
+        instance_type = self._mock_stub_type("_patcher", list(mock_bounds))
         if attribute is None:
             return instance_type
         return self._specialized_patcher_attribute_type(instance_type, attribute)
@@ -61,7 +121,11 @@ class PatchCallChecker(CheckerWrapper):
             return attribute_type
         return expand_type_by_instance(attribute_type, instance_type)
 
-    def _mock_bounds(self, original_type: Type) -> tuple[Type, Type] | None:
+    def _mock_bounds(
+        self, original_type: Type, *, is_property: bool = False
+    ) -> tuple[Type, Type] | None:
+        if is_property:
+            return self._mock_stub_type("PropertyMock", [original_type]), original_type
         if isinstance(original_type, CallableType):
             parameters = Parameters(
                 original_type.arg_types,
@@ -71,14 +135,36 @@ class PatchCallChecker(CheckerWrapper):
                 is_ellipsis_args=original_type.is_ellipsis_args,
                 imprecise_arg_kinds=original_type.imprecise_arg_kinds,
             )
+            if (awaited_type := self._awaited_type(original_type)) is not None:
+                return (
+                    self._mock_stub_type("AsyncMock", [parameters, awaited_type]),
+                    original_type,
+                )
             ret = original_type.ret_type
             return (
-                self.checker.named_generic_type(f"{TYPES_MODULE}.mock.Mock", [parameters, ret]),
+                self._mock_stub_type("Mock", [parameters, ret]),
                 original_type,
             )
 
         if isinstance(original_type, Overloaded):
             return original_type, original_type
         if isinstance(original_type, Instance):
-            return (self.checker.named_type(f"{TYPES_MODULE}.mock.MagicMock"), original_type)
+            return (self._mock_stub_type("MagicMock"), original_type)
         return None
+
+    @classmethod
+    def _awaited_type(cls, callable_type: CallableType) -> Type | None:
+        if (
+            isinstance(definition := callable_type.definition, FuncDef)
+            and definition.is_coroutine
+            and isinstance(ret_type := get_proper_type(callable_type.ret_type), Instance)
+            and ret_type.type.fullname == "typing.Coroutine"
+        ):
+            return ret_type.args[-1]
+        return None
+
+    def _mock_stub_type(self, name: str, args: list[Type] | None = None) -> Instance:
+        instance_type = self.named_type(Fullname((TYPES_MODULE, "mock", name)))
+        if args is None:
+            return instance_type
+        return instance_type.copy_modified(args=args)
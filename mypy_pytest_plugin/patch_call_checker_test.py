@@ -1,7 +1,9 @@
 import textwrap
+from unittest import mock
 
 from inline_snapshot import snapshot
-from mypy.nodes import CallExpr, Expression
+from mypy.nodes import MDEF, CallExpr, Expression, FuncDef, SymbolTableNode, TypeInfo, Var
+from mypy.types import AnyType, CallableType, TypeOfAny
 
 from .patch_call_checker import PatchCallChecker
 from .test_utils import dump_expr, parse
@@ -116,7 +118,7 @@ def test_string_value_unreadable() -> None:
 def _specialized_patcher_type_test_body(
     defs: str, expected_type: str | None, *, attribute: str | None = None
 ) -> None:
-    defs = f"import mypy_pytest_plugin_types\n{textwrap.dedent(defs)}"
+    defs = f"import mypy_pytest_plugin_types.mock\n{textwrap.dedent(defs)}"
     parse_result = parse(defs)
     original_type = parse_result.types["original"]
     assert original_type is not None
@@ -210,3 +212,149 @@ def test_specialized_patcher_type_object_type() -> None:
             "mypy_pytest_plugin_types.mock._patcher[mypy_pytest_plugin_types.mock.MagicMock[Any, Any], int]"
         ),
     )
+
+
+def test_specialized_patcher_type_original_coroutine() -> None:
+    _specialized_patcher_type_test_body(
+        """
+        async def coroutine(x: int) -> str:
+            return str(x)
+
+        original = coroutine
+        """,
+        snapshot(
+            "mypy_pytest_plugin_types.mock._patcher[mypy_pytest_plugin_types.mock.AsyncMock[[x: int], str], def (x: int) -> typing.Coroutine[Any, Any, str]]"
+        ),
+    )
+
+
+def test_add_patch_generics_property_target() -> None:
+    parse_result = parse(
+        """
+        import mypy_pytest_plugin_types.mock
+        from unittest import mock
+
+        class Foo:
+            @property
+            def value(self) -> int:
+                return 0
+
+        call = mock.patch("test_module.Foo.value")
+        """
+    )
+    parse_result.accept_all()
+    call = parse_result.defs["call"]
+    assert isinstance(call, CallExpr)
+    patcher_type = PatchCallChecker(parse_result.checker).add_patch_generics(call)
+    assert str(patcher_type) == snapshot(
+        "mypy_pytest_plugin_types.mock._patcher[mypy_pytest_plugin_types.mock.PropertyMock[int], int]"
+    )
+
+
+def test_add_patch_generics_reuses_target_patcher_type() -> None:
+    parse_result = parse(
+        """
+        import mypy_pytest_plugin_types.mock
+        from unittest import mock
+
+        def original(x: int) -> int:
+            return x
+
+        first = mock.patch("test_module.original")
+        second = mock.patch("test_module.original")
+        """
+    )
+    parse_result.accept_all()
+    with mock.patch.object(
+        PatchCallChecker,
+        "_specialized_patcher_type",
+        autospec=True,
+        side_effect=PatchCallChecker._specialized_patcher_type,
+    ) as specialized_patcher_type:
+        patcher_types = []
+        for name in ("first", "second"):
+            call = parse_result.defs[name]
+            assert isinstance(call, CallExpr)
+            patcher_types.append(PatchCallChecker(parse_result.checker).add_patch_generics(call))
+    specialized_patcher_type.assert_called_once()
+    [first, second] = patcher_types
+    assert first is not None
+    assert first is second
+
+
+def test_add_patch_generics_rechecked_target() -> None:
+    parse_result = parse(
+        """
+        import mypy_pytest_plugin_types.mock
+        from unittest import mock
+
+        def original(x: int) -> int:
+            return x
+
+        call = mock.patch("test_module.original")
+        """
+    )
+    parse_result.accept_all()
+    call = parse_result.defs["call"]
+    assert isinstance(call, CallExpr)
+    patch_call_checker = PatchCallChecker(parse_result.checker)
+    assert str(patch_call_checker.add_patch_generics(call)) == snapshot(
+        "mypy_pytest_plugin_types.mock._patcher[mypy_pytest_plugin_types.mock.Mock[[x: int], int], def (x: int) -> int]"
+    )
+
+    original = parse_result.checker.tree.names["original"].node
+    assert isinstance(original, FuncDef)
+    assert isinstance(original.type, CallableType)
+    original.type = original.type.copy_modified(
+        ret_type=parse_result.checker.named_type("builtins.str")
+    )
+    assert str(patch_call_checker.add_patch_generics(call)) == snapshot(
+        "mypy_pytest_plugin_types.mock._patcher[mypy_pytest_plugin_types.mock.Mock[[x: int], str], def (x: int) -> str]"
+    )
+
+
+def test_add_patch_generics_rechecked_mock_kind() -> None:
+    parse_result = parse(
+        """
+        import mypy_pytest_plugin_types.mock
+        from unittest import mock
+
+        def original() -> int:
+            return 0
+
+        class Foo:
+            @property
+            def value(self) -> int:
+                return 0
+
+        function_call = mock.patch("test_module.original")
+        property_call = mock.patch("test_module.Foo.value")
+        """
+    )
+    parse_result.accept_all()
+    checker = parse_result.checker
+    patch_call_checker = PatchCallChecker(checker)
+    function_call = parse_result.defs["function_call"]
+    property_call = parse_result.defs["property_call"]
+    assert isinstance(function_call, CallExpr)
+    assert isinstance(property_call, CallExpr)
+    assert "mock.Mock[" in str(patch_call_checker.add_patch_generics(function_call))
+    assert "PropertyMock" in str(patch_call_checker.add_patch_generics(property_call))
+
+    original = checker.tree.names["original"].node
+    assert isinstance(original, FuncDef)
+    assert isinstance(original.type, CallableType)
+    int_type = checker.named_type("builtins.int")
+    any_type = AnyType(TypeOfAny.special_form)
+    original.is_coroutine = True
+    original.type = original.type.copy_modified(
+        ret_type=checker.named_generic_type("typing.Coroutine", [any_type, any_type, int_type])
+    )
+    foo = checker.tree.names["Foo"].node
+    assert isinstance(foo, TypeInfo)
+    value = Var("value", int_type)
+    value.info = foo
+    foo.names["value"] = SymbolTableNode(MDEF, value)
+
+    assert "AsyncMock[[], int]" in str(patch_call_checker.add_patch_generics(function_call))
+    assert "PropertyMock" not in str(patch_call_checker.add_patch_generics(property_call))
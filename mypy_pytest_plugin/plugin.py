@@ -1,14 +1,24 @@
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 import functools
-from typing import Literal, cast
+from typing import ClassVar, Literal, cast
 
 from mypy.checker import TypeChecker
-from mypy.nodes import CallExpr, Decorator, Expression, MemberExpr, MypyFile
+from mypy.nodes import (
+    CallExpr,
+    Decorator,
+    Expression,
+    Import,
+    ImportAll,
+    ImportFrom,
+    MemberExpr,
+    MypyFile,
+)
 from mypy.options import Options
 from mypy.plugin import AttributeContext, FunctionContext, FunctionSigContext, MethodContext, Plugin
 from mypy.types import CallableType, FunctionLike, Type
 
 from .defer import DeferralError, DeferralReason
+from .error_code_gate import Analysis, ErrorCodeGate
 from .excluded_test_checker import ExcludedTestChecker
 from .fixture import Fixture
 from .fixture_manager import FixtureManager
@@ -26,6 +36,8 @@ from .utils import compose
 
 
 class PytestPlugin(Plugin):
+    MOCK_MODULES: ClassVar[Collection[str]] = ("unittest.mock", "mock")
+
     def __init__(self, options: Options) -> None:
         for module_pattern in "*.conftest", "conftest":
             options.per_module_options.setdefault(module_pattern, {})["ignore_missing_imports"] = (
@@ -46,6 +58,8 @@ class PytestPlugin(Plugin):
             self.module_to_dep(TYPES_MODULE),
             self.module_to_dep("_pytest.fixtures"),
         ]
+        if self._imports_mock(file):
+            deps.append(self.module_to_dep(f"{TYPES_MODULE}.mock"))
         if TestNameChecker.is_test_file_name(file.name) or file.name == "conftest":
             deps.extend(map(self.module_to_dep, FixtureManager.default_fixture_module_names()))
             deps.extend(
@@ -56,6 +70,29 @@ class PytestPlugin(Plugin):
             )
         return deps
 
+    @classmethod
+    def _imports_mock(cls, file: MypyFile) -> bool:
+        for import_ in file.imports:
+            match import_:
+                case Import(ids=ids) if any(cls._is_mock_module(id_) for id_, _alias in ids):
+                    return True
+                case ImportFrom(id="unittest", relative=0, names=names) if any(
+                    name == "mock" for name, _alias in names
+                ):
+                    return True
+                case ImportFrom(id=id_, relative=0) | ImportAll(id=id_, relative=0) if (
+                    cls._is_mock_module(id_)
+                ):
+                    return True
+        return False
+
+    @classmethod
+    def _is_mock_module(cls, module: str) -> bool:
+        return any(
+            module == mock_module or module.startswith(f"{mock_module}.")
+            for mock_module in cls.MOCK_MODULES
+        )
+
     @classmethod
     def module_to_dep(cls, module: str | Fullname) -> tuple[int, str, int]:
         if not isinstance(module, str):
@@ -73,6 +110,7 @@ class PytestPlugin(Plugin):
             not ctx.is_lvalue
             and isinstance(checker := ctx.api, TypeChecker)
             and isinstance(expr := ctx.context, MemberExpr)
+            and ErrorCodeGate(checker).is_enabled(Analysis.MARK_NAMES)
         ):
             MarkChecker(checker).check_attribute(expr)
         return ctx.default_attr_type
@@ -94,7 +132,11 @@ class PytestPlugin(Plugin):
         return ctx.default_signature
 
     def check_param_mark(self, ctx: FunctionContext) -> Type:
-        if isinstance(ctx.api, TypeChecker) and isinstance(ctx.context, CallExpr):
+        if (
+            isinstance(ctx.api, TypeChecker)
+            and isinstance(ctx.context, CallExpr)
+            and ErrorCodeGate(ctx.api).is_enabled(Analysis.PARAM_MARKS)
+        ):
             ParamMarkChecker(ctx.api).check_param_marks(ctx.context)
         return ctx.default_return_type
 
@@ -135,6 +177,7 @@ class PytestPlugin(Plugin):
         if (
             isinstance(ctx.context, CallExpr)
             and isinstance(ctx.api, TypeChecker)
+            and ErrorCodeGate(ctx.api).is_enabled(Analysis.ITERABLE_SEQUENCE)
             and TestNameChecker.is_test_file_name(ctx.api.tree.fullname)
             and ctx.context.line in TestBodyRanges.from_defs(ctx.api.tree.defs)
             and all(cls._is_real_argument(arg) for arg in ctx.context.args)
@@ -181,7 +224,8 @@ class PytestPlugin(Plugin):
             if ExcludedTestChecker.is_test(
                 decorator.fullname, checker=checker
             ) and self._is_deferred(decorator):
-                ReturnTypeChecker.check_return_type(decorator.func, checker=checker)
+                if ErrorCodeGate(checker).is_enabled(Analysis.TEST_RETURN_TYPE):
+                    ReturnTypeChecker.check_return_type(decorator.func, checker=checker)
                 TestInfo.check_parametrization(decorator, checker=checker)
         return None
 
@@ -0,0 +1,88 @@
+import subprocess
+import sys
+from unittest import mock
+
+from mypy.nodes import CallExpr, ExpressionStmt, FuncDef
+from mypy.plugin import FunctionContext
+from mypy.types import AnyType, TypeOfAny
+import pytest
+
+from .error_codes import ITERABLE_SEQUENCE
+from .iterable_sequence_checker import IterableSequenceChecker
+from .plugin import PytestPlugin
+from .test_utils import parse
+
+
+def test_plugin_import_does_not_import_pytest() -> None:
+    script = (
+        "import sys\n"
+        "import mypy_pytest_plugin.plugin\n"
+        "print(*sorted(name for name in sys.modules if name.split('.')[0] in {'pytest', '_pytest'}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == []
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("import unittest.mock", True),
+        ("import unittest.mock as m", True),
+        ("from unittest import mock", True),
+        ("from unittest.mock import patch", True),
+        ("from unittest.mock import *", True),
+        ("import mock", True),
+        ("import mockito", False),
+        ("import unittest", False),
+        ("from unittest import TestCase", False),
+        ("import os.path", False),
+    ],
+)
+def test_plugin_imports_mock(code: str, expected: bool) -> None:
+    assert PytestPlugin._imports_mock(parse(code).checker.tree) is expected
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_plugin_check_iterable_sequence_skipped_when_disabled(enabled: bool) -> None:
+    parse_result = parse(
+        """
+        from typing import Iterable
+
+        def foo(x: Iterable[int]) -> None: ...
+
+        def test_foo() -> None:
+            foo([1])
+        """,
+        module_name="sample_test",
+    )
+    checker = parse_result.checker
+    parse_result.accept_all()
+    test_def = parse_result.defs["test_foo"]
+    assert isinstance(test_def, FuncDef)
+    [statement] = test_def.body.body
+    assert isinstance(statement, ExpressionStmt)
+    call = statement.expr
+    assert isinstance(call, CallExpr)
+
+    options = checker.options.apply_changes({})
+    if not enabled:
+        options.disabled_error_codes.add(ITERABLE_SEQUENCE)
+    checker.errors.set_file(checker.path, checker.tree.fullname, options=options)
+    ctx = FunctionContext(
+        arg_types=[],
+        arg_kinds=[],
+        callee_arg_names=[],
+        arg_names=[],
+        default_return_type=AnyType(TypeOfAny.special_form),
+        args=[],
+        context=call,
+        api=checker,
+    )
+    with mock.patch.object(
+        IterableSequenceChecker, "check_iterable_sequence_call", autospec=True
+    ) as check_iterable_sequence_call:
+        PytestPlugin.check_iterable_sequence(ctx)
+
+    assert check_iterable_sequence_call.called is enabled
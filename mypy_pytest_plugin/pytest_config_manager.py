@@ -1,16 +1,37 @@
+from __future__ import annotations
+
 import functools
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, ClassVar
+
+from .pytest_ini_reader import PytestIniReader
+
+if TYPE_CHECKING:
+    from _pytest.fixtures import FixtureManager as PytestFixtureManager
+    from pytest import Config, Session
 
-import _pytest.config
-from pytest import Config, Session
+logger = logging.getLogger(__name__)
 
 
 class PytestConfigManager:
+    REFRESH_INTERVAL: ClassVar[float] = 1.0
+    _fingerprint: ClassVar[tuple[object, ...] | None] = None
+    _fingerprint_checked_at: ClassVar[float] = 0.0
+
     @classmethod
     @functools.cache
     def session(cls) -> Session:
+        import _pytest.config
+        from _pytest.main import Session
+
+        start = time.perf_counter()
         config = _pytest.config.get_config()
         config.parse(["-s"])
-        return Session.from_config(config)
+        session = Session.from_config(config)
+        logger.debug("pytest session bootstrapped in %.3fs", time.perf_counter() - start)
+        return session
 
     @classmethod
     def config(cls) -> Config:
@@ -18,15 +39,54 @@ class PytestConfigManager:
 
     @classmethod
     @functools.cache
+    def fixture_manager(cls) -> PytestFixtureManager:
+        from _pytest.fixtures import FixtureManager as PytestFixtureManager
+
+        start = time.perf_counter()
+        fixture_manager = PytestFixtureManager(cls.session())
+        logger.debug("pytest fixtures collected in %.3fs", time.perf_counter() - start)
+        return fixture_manager
+
+    @classmethod
+    def fingerprint(cls) -> tuple[object, ...]:
+        now = time.monotonic()
+        if cls._fingerprint is None or now - cls._fingerprint_checked_at >= cls.REFRESH_INTERVAL:
+            fingerprint = PytestIniReader.fingerprint(Path.cwd())
+            if fingerprint != cls._fingerprint:
+                cls._fingerprint = fingerprint
+            cls._fingerprint_checked_at = now
+        assert cls._fingerprint is not None
+        return cls._fingerprint
+
+    @classmethod
+    def ini_reader(cls) -> PytestIniReader | None:
+        return cls._ini_reader(cls.fingerprint())
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def _ini_reader(cls, fingerprint: tuple[object, ...]) -> PytestIniReader | None:
+        return PytestIniReader.locate(Path.cwd())
+
+    @classmethod
+    def getini(cls, name: str) -> list[str]:
+        ini_reader = cls.ini_reader()
+        if ini_reader is None:
+            return cls.config().getini(name)
+        return ini_reader.getini(name)
+
+    @classmethod
     def file_patterns(cls) -> list[str]:
-        return cls.config().getini("python_files")
+        return cls._cached_getini(cls.fingerprint(), "python_files")
 
     @classmethod
-    @functools.cache
     def fn_patterns(cls) -> list[str]:
-        return cls.config().getini("python_functions")
+        return cls._cached_getini(cls.fingerprint(), "python_functions")
 
     @classmethod
-    @functools.cache
     def markers(cls) -> list[str]:
-        return cls.config().getini("markers")
+        return cls._cached_getini(cls.fingerprint(), "markers")
+
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _cached_getini(cls, fingerprint: tuple[object, ...], name: str) -> list[str]:
+        return cls.getini(name)
@@ -0,0 +1,132 @@
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import shlex
+import tomllib
+from typing import Any, ClassVar, Self
+
+import iniconfig
+
+
+@dataclass(frozen=True, slots=True)
+class PytestIniReader:
+    values: Mapping[str, str | list[str]]
+
+    CONFIG_NAMES: ClassVar[Sequence[str]] = (
+        "pytest.toml",
+        ".pytest.toml",
+        "pytest.ini",
+        ".pytest.ini",
+        "pyproject.toml",
+        "tox.ini",
+        "setup.cfg",
+    )
+    LINELIST_NAMES: ClassVar[frozenset[str]] = frozenset({"markers"})
+    DEFAULTS: ClassVar[Mapping[str, list[str]]] = {
+        "python_files": ["test_*.py", "*_test.py"],
+        "python_functions": ["test"],
+        "markers": [],
+    }
+    OVERRIDE_OPTIONS: ClassVar[frozenset[str]] = frozenset(
+        {"-o", "--override-ini", "-c", "--config-file", "--rootdir"}
+    )
+
+    @classmethod
+    def locate(cls, invocation_dir: Path) -> Self | None:
+        try:
+            reader = cls._locate(invocation_dir)
+        except (iniconfig.ParseError, tomllib.TOMLDecodeError, OSError):
+            return None
+        if reader.has_overrides():
+            return None
+        return reader
+
+    @classmethod
+    def _locate(cls, invocation_dir: Path) -> Self:
+        for path in cls._candidate_paths(invocation_dir):
+            if path.is_file() and (values := cls.load(path)) is not None:
+                return cls(values)
+        return cls({})
+
+    @classmethod
+    def _candidate_paths(cls, invocation_dir: Path) -> Iterator[Path]:
+        for base in (invocation_dir, *invocation_dir.parents):
+            for config_name in cls.CONFIG_NAMES:
+                yield base / config_name
+
+    @classmethod
+    def fingerprint(cls, invocation_dir: Path) -> tuple[object, ...]:
+        entries: list[object] = [os.environ.get("PYTEST_ADDOPTS", "")]
+        for path in cls._candidate_paths(invocation_dir):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+        return tuple(entries)
+
+    @classmethod
+    def load(cls, path: Path) -> Mapping[str, str | list[str]] | None:
+        match path.suffix:
+            case ".ini":
+                config = iniconfig.IniConfig(str(path))
+                if "pytest" in config:
+                    return dict(config["pytest"].items())
+                if path.name in {"pytest.ini", ".pytest.ini"}:
+                    return {}
+            case ".cfg":
+                config = iniconfig.IniConfig(str(path))
+                if "tool:pytest" in config:
+                    return dict(config["tool:pytest"].items())
+            case ".toml":
+                return cls._load_toml(path)
+        return None
+
+    @classmethod
+    def _load_toml(cls, path: Path) -> Mapping[str, str | list[str]] | None:
+        config = tomllib.loads(path.read_text(encoding="utf-8"))
+        if path.name in {"pytest.toml", ".pytest.toml"}:
+            return cls._scalar_values(config.get("pytest", {}))
+        tool_pytest = config.get("tool", {}).get("pytest", {})
+        toml_config = {key: value for key, value in tool_pytest.items() if key != "ini_options"}
+        if toml_config:
+            return cls._scalar_values(toml_config)
+        if (ini_config := tool_pytest.get("ini_options")) is not None:
+            return cls._scalar_values(ini_config)
+        return None
+
+    @classmethod
+    def _scalar_values(cls, values: Mapping[str, Any]) -> Mapping[str, str | list[str]]:
+        return {
+            key: list(map(str, value)) if isinstance(value, list) else str(value)
+            for key, value in values.items()
+        }
+
+    def has_overrides(self) -> bool:
+        args = [
+            *self._args(self.values.get("addopts", [])),
+            *shlex.split(os.environ.get("PYTEST_ADDOPTS", "")),
+        ]
+        return any(
+            arg.split("=")[0] in self.OVERRIDE_OPTIONS or arg.startswith(("-o", "-c"))
+            for arg in args
+        )
+
+    def getini(self, name: str) -> list[str]:
+        value = self.values.get(name)
+        if value is None:
+            return list(self.DEFAULTS[name])
+        if name in self.LINELIST_NAMES:
+            return self._lines(value)
+        return self._args(value)
+
+    @classmethod
+    def _args(cls, value: str | list[str]) -> list[str]:
+        return shlex.split(value) if isinstance(value, str) else value
+
+    @classmethod
+    def _lines(cls, value: str | list[str]) -> list[str]:
+        if isinstance(value, str):
+            return [line for line in map(str.strip, value.split("\n")) if line]
+        return value
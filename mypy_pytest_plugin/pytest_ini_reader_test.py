@@ -0,0 +1,118 @@
+from pathlib import Path
+import textwrap
+
+import pytest
+
+from .pytest_config_manager import PytestConfigManager
+from .pytest_ini_reader import PytestIniReader
+
+
+def _pytest_ini_reader_test_body(
+    tmp_path: Path, files: dict[str, str], name: str, expected: list[str] | None
+) -> None:
+    for file_name, content in files.items():
+        (tmp_path / file_name).write_text(textwrap.dedent(content))
+    invocation_dir = tmp_path / "sub"
+    invocation_dir.mkdir()
+    reader = PytestIniReader.locate(invocation_dir)
+    if expected is None:
+        assert reader is None
+    else:
+        assert reader is not None
+        assert reader.getini(name) == expected
+
+
+def test_pytest_ini_reader_pytest_ini(tmp_path: Path) -> None:
+    _pytest_ini_reader_test_body(
+        tmp_path,
+        {"pytest.ini": "[pytest]\npython_files = check_*.py *_check.py\n"},
+        "python_files",
+        ["check_*.py", "*_check.py"],
+    )
+
+
+def test_pytest_ini_reader_pytest_ini_takes_precedence(tmp_path: Path) -> None:
+    _pytest_ini_reader_test_body(
+        tmp_path,
+        {
+            "pytest.ini": "[other]\n",
+            "tox.ini": "[pytest]\npython_functions = check\n",
+        },
+        "python_functions",
+        ["test"],
+    )
+
+
+def test_pytest_ini_reader_pyproject_ini_options(tmp_path: Path) -> None:
+    _pytest_ini_reader_test_body(
+        tmp_path,
+        {
+            "pyproject.toml": """
+                [tool.pytest.ini_options]
+                python_functions = ["check", "verify"]
+            """,
+            "setup.cfg": "[tool:pytest]\npython_functions = other\n",
+        },
+        "python_functions",
+        ["check", "verify"],
+    )
+
+
+def test_pytest_ini_reader_pyproject_without_section(tmp_path: Path) -> None:
+    _pytest_ini_reader_test_body(
+        tmp_path,
+        {
+            "pyproject.toml": "[tool.other]\n",
+            "tox.ini": "[pytest]\npython_functions = check\n",
+        },
+        "python_functions",
+        ["check"],
+    )
+
+
+def test_pytest_ini_reader_setup_cfg_markers(tmp_path: Path) -> None:
+    _pytest_ini_reader_test_body(
+        tmp_path,
+        {
+            "setup.cfg": """
+                [tool:pytest]
+                markers =
+                    slow: marks slow tests
+                    serial
+            """
+        },
+        "markers",
+        ["slow: marks slow tests", "serial"],
+    )
+
+
+def test_pytest_ini_reader_defaults(tmp_path: Path) -> None:
+    _pytest_ini_reader_test_body(tmp_path, {}, "python_files", ["test_*.py", "*_test.py"])
+
+
+@pytest.mark.parametrize("addopts", ["-o python_files=check_*.py", "--override-ini=markers="])
+def test_pytest_ini_reader_overrides_fall_back(tmp_path: Path, addopts: str) -> None:
+    _pytest_ini_reader_test_body(
+        tmp_path, {"pytest.ini": f"[pytest]\naddopts = {addopts}\n"}, "python_files", None
+    )
+
+
+def test_pytest_ini_reader_invalid_file_falls_back(tmp_path: Path) -> None:
+    _pytest_ini_reader_test_body(tmp_path, {"pyproject.toml": "[tool.pytest"}, "markers", None)
+
+
+def test_pytest_ini_reader_fingerprint_tracks_config_files(tmp_path: Path) -> None:
+    invocation_dir = tmp_path / "sub"
+    invocation_dir.mkdir()
+    fingerprint = PytestIniReader.fingerprint(invocation_dir)
+    assert PytestIniReader.fingerprint(invocation_dir) == fingerprint
+    (tmp_path / "tox.ini").write_text("[pytest]\n")
+    created = PytestIniReader.fingerprint(invocation_dir)
+    assert created != fingerprint
+    (tmp_path / "tox.ini").write_text("[pytest]\nmarkers = slow\n")
+    assert PytestIniReader.fingerprint(invocation_dir) != created
+
+
+@pytest.mark.parametrize("name", ["python_files", "python_functions", "markers"])
+def test_pytest_ini_reader_matches_pytest_config(name: str) -> None:
+    assert PytestConfigManager.getini(name) == PytestConfigManager.config().getini(name)
@@ -5,7 +5,7 @@ from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, S
 from dataclasses import dataclass, field
 import functools
 import itertools
-from typing import Any, TypeGuard, cast
+from typing import Any, ClassVar, TypeGuard, cast
 
 from mypy.checker import TypeChecker
 from mypy.errorcodes import VALID_TYPE
@@ -17,6 +17,7 @@ from mypy.subtypes import is_subtype
 from mypy.types import AnyType, CallableType, TypeOfAny, UninhabitedType
 
 from .checker_wrapper import CheckerWrapper
+from .error_code_gate import Analysis, ErrorCodeGate
 from .error_codes import FIXTURE_ARGUMENT_TYPE, INVERTED_FIXTURE_SCOPE, MISSING_ARGNAME
 from .fixture import Fixture, FixtureScope
 from .fixture_manager import FixtureManager
@@ -68,6 +69,12 @@ class RequestGraph(CheckerWrapper):
     requests: Sequence[RequestNode]
     context: Context
 
+    ANALYSES: ClassVar[Sequence[Analysis]] = (
+        Analysis.FIXTURE_RESOLUTION,
+        Analysis.FIXTURE_SCOPE,
+        Analysis.FIXTURE_ARGUMENT_TYPE,
+    )
+
     @classmethod
     def build(
         cls,
@@ -149,9 +156,13 @@ class RequestGraph(CheckerWrapper):
         return iter(self.requests)
 
     def check(self) -> None:
-        self._check_resolved()
-        self._check_scope()
-        self._check_request_types()
+        gate = ErrorCodeGate(self.checker)
+        if gate.is_enabled(Analysis.FIXTURE_RESOLUTION):
+            self._check_resolved()
+        if gate.is_enabled(Analysis.FIXTURE_SCOPE):
+            self._check_scope()
+        if gate.is_enabled(Analysis.FIXTURE_ARGUMENT_TYPE):
+            self._check_request_types()
 
     def _check_resolved(self) -> None:
         for request in self:
@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Collection, Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 import functools
 import itertools
@@ -7,10 +7,10 @@ from typing import Self
 from mypy.checker import TypeChecker
 from mypy.nodes import Context, Decorator, Expression, FuncDef
 
-from .argnames_parser import ArgnamesParser
 from .argvalues import Argvalues
 from .checker_wrapper import CheckerWrapper
 from .decorator_wrapper import DecoratorWrapper
+from .error_code_gate import ErrorCodeGate
 from .error_codes import DUPLICATE_ARGNAME, REPEATED_FIXTURE_ARGNAME, UNKNOWN_ARGNAME
 from .fixture import Fixture
 from .fixture_manager import FixtureManager
@@ -76,24 +76,24 @@ class TestInfo(CheckerWrapper):
         return self.many_items_sub_signature(arg_names)
 
     def one_item_sub_signature(self, arg_name: str) -> TestSignature:
+        request = self.argname_types[arg_name]
         return OneItemTestSignature(
             checker=self.checker,
             fn_name=self.fn_name,
             arg_name=arg_name,
-            arg_type=self.argname_types[arg_name].type_,
-            type_variables=self.argname_types[arg_name].type_variables,
+            arg_type=request.type_,
+            type_variables=request.type_variables,
         )
 
     def many_items_sub_signature(self, arg_names: list[str]) -> TestSignature:
+        requests = [self.argname_types[arg_name] for arg_name in arg_names]
         return ManyItemsTestSignature(
             checker=self.checker,
             fn_name=self.fn_name,
             arg_names=arg_names,
-            arg_types=[self.argname_types[arg_name].type_ for arg_name in arg_names],
+            arg_types=[request.type_ for request in requests],
             type_variables=list(
-                itertools.chain.from_iterable(
-                    self.argname_types[arg_name].type_variables for arg_name in arg_names
-                )
+                itertools.chain.from_iterable(request.type_variables for request in requests)
             ),
         )
 
@@ -114,7 +114,7 @@ class TestInfo(CheckerWrapper):
         return RequestGraph.build(
             requests=self.requests,
             available_fixtures=self._available_fixtures,
-            parametrized_names=self.parametrized_argnames,
+            parametrized_names=self._parametrized_argname_set,
             autouse_names=self.autouse_names,
             fullname=self.fullname,
             checker=self.checker,
@@ -134,9 +134,9 @@ class TestInfo(CheckerWrapper):
 
     @functools.cached_property
     def argname_types(self) -> Mapping[str, Request]:
-        return self.request_graph.argname_types(self.parametrized_argnames)
+        return self.request_graph.argname_types(self._parametrized_argname_set)
 
-    @property
+    @functools.cached_property
     def parametrized_argnames(self) -> Sequence[str]:
         return list(
             itertools.chain.from_iterable(
@@ -144,18 +144,22 @@ class TestInfo(CheckerWrapper):
             )
         )
 
+    @functools.cached_property
+    def _parametrized_argname_set(self) -> Collection[str]:
+        return frozenset(self.parametrized_argnames)
+
     def _decorator_argnames(self, decorator: DecoratorWrapper) -> list[str]:
-        if decorator.arg_names is not None:
-            match self._argnames_parser.parse_names(decorator.arg_names):
-                case str() as argname:
-                    return [argname]
-                case [*argnames]:
-                    return argnames
+        match decorator.parsed_arg_names:
+            case str() as argname:
+                return [argname]
+            case [*argnames]:
+                return argnames
         return []
 
     def check(self) -> None:
         self.check_decorators(self.decorators)
-        self.request_graph.check()
+        if ErrorCodeGate(self.checker).is_enabled(*RequestGraph.ANALYSES):
+            self.request_graph.check()
 
     def check_decorators(self, decorators: Iterable[DecoratorWrapper]) -> None:
         for decorator in decorators:
@@ -164,16 +168,16 @@ class TestInfo(CheckerWrapper):
     def check_decorator(self, decorator: DecoratorWrapper) -> None:
         arg_names_and_arg_values = decorator.arg_names_and_arg_values
         if arg_names_and_arg_values is not None:
-            self._check_argnames_and_argvalues(*arg_names_and_arg_values)
-
-    @property
-    def _argnames_parser(self) -> ArgnamesParser:
-        return ArgnamesParser(self.checker)
+            self._check_argnames_and_argvalues(
+                decorator.parsed_arg_names, *arg_names_and_arg_values
+            )
 
     def _check_argnames_and_argvalues(
-        self, arg_names_expr: Expression, arg_values_expr: Expression
+        self,
+        arg_names: str | list[str] | None,
+        arg_names_expr: Expression,
+        arg_values_expr: Expression,
     ) -> None:
-        arg_names = self._argnames_parser.parse_names(arg_names_expr)
         if arg_names is not None and self._check_arg_names(arg_names, context=arg_names_expr):
             sub_signature = self.sub_signature(arg_names)
             if sub_signature is not None:
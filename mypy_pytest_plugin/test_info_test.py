@@ -4,6 +4,7 @@ from mypy.nodes import FuncDef
 from mypy.types import CallableType
 import pytest
 
+from .argnames_parser import ArgnamesParser
 from .fixture_manager import FixtureManager
 from .test_info import TestInfo
 from .test_utils import (
@@ -550,6 +551,23 @@ def test_test_info_check_multiple_decorators_duplicate_argnames() -> None:
     )
 
 
+def test_test_info_check_parses_argnames_once_per_decorator() -> None:
+    with mock.patch.object(
+        ArgnamesParser, "parse_names", autospec=True, side_effect=ArgnamesParser.parse_names
+    ) as parse_names:
+        _test_info_check_test_body(
+            """
+            import pytest
+
+            @pytest.mark.parametrize("x, y", [(1, "a"), (2, "b")])
+            @pytest.mark.parametrize(["z"], [(True,), (False,)])
+            def test_info(x: int, y: str, z: bool) -> None:
+                ...
+            """
+        )
+    assert parse_names.call_count == 2
+
+
 def test_test_info_check_multiple_decorators_single_type_error() -> None:
     _test_info_check_test_body(
         """
@@ -1,14 +1,53 @@
-from collections.abc import MutableSequence
+from collections.abc import Iterable, MutableSequence
+from dataclasses import dataclass
 import fnmatch
 import functools
-from pathlib import Path
-
-from _pytest.pathlib import fnmatch_ex
+import os
+from pathlib import Path, PurePath
+import re
+from typing import ClassVar, Self
 
 from .pytest_config_manager import PytestConfigManager
+from .utils import ScopedCache
+
+
+@dataclass(frozen=True, slots=True)
+class FilePatternMatcher:
+    name_regex: re.Pattern[str]
+    path_regex: re.Pattern[str]
+    absolute_path_regex: re.Pattern[str]
+
+    @classmethod
+    @functools.cache
+    def compile(cls, patterns: tuple[str, ...]) -> Self:
+        patterns = tuple(map(os.path.normcase, patterns))
+        path_patterns = [pattern for pattern in patterns if os.sep in pattern]
+        return cls(
+            cls._compile_globs(pattern for pattern in patterns if os.sep not in pattern),
+            cls._compile_globs(path_patterns),
+            cls._compile_globs(
+                pattern if os.path.isabs(pattern) else f"*{os.sep}{pattern}"
+                for pattern in path_patterns
+            ),
+        )
+
+    @classmethod
+    def _compile_globs(cls, patterns: Iterable[str]) -> re.Pattern[str]:
+        return re.compile("|".join(map(fnmatch.translate, patterns)) or "(?!)")
+
+    def matches(self, path: PurePath) -> bool:
+        if self.name_regex.match(os.path.normcase(path.name)) is not None:
+            return True
+        path_regex = self.absolute_path_regex if path.is_absolute() else self.path_regex
+        return path_regex.match(os.path.normcase(str(path))) is not None
 
 
 class TestNameChecker:
+    CACHE_SIZE: ClassVar[int] = 2**16
+    _file_name_cache: ClassVar[ScopedCache[str, bool]] = ScopedCache(CACHE_SIZE)
+    _path_cache: ClassVar[ScopedCache[PurePath, bool]] = ScopedCache(CACHE_SIZE)
+    _fn_name_cache: ClassVar[ScopedCache[str, bool]] = ScopedCache(CACHE_SIZE)
+
     @classmethod
     def is_test_name(cls, fullname: str) -> bool:
         path, function = cls._split_fullname(fullname)
@@ -26,19 +65,43 @@ class TestNameChecker:
         return Path(*sections)
 
     @classmethod
-    @functools.cache
     def is_test_file_name(cls, name: str) -> bool:
-        path = cls._path_from_sections(name.split("."))
-        return cls.is_test_path(path)
+        return cls._file_name_cache.get(
+            PytestConfigManager.fingerprint(),
+            name,
+            lambda: cls._file_pattern_matcher().matches(cls._path_from_sections(name.split("."))),
+        )
 
     @classmethod
-    @functools.cache
-    def is_test_path(cls, path: Path) -> bool:
-        return any(fnmatch_ex(pattern, path) for pattern in PytestConfigManager.file_patterns())
+    def is_test_path(cls, path: PurePath) -> bool:
+        return cls._path_cache.get(
+            PytestConfigManager.fingerprint(),
+            path,
+            lambda: cls._file_pattern_matcher().matches(path),
+        )
+
+    @classmethod
+    def _file_pattern_matcher(cls) -> FilePatternMatcher:
+        return FilePatternMatcher.compile(tuple(PytestConfigManager.file_patterns()))
 
     @classmethod
     def is_test_fn_name(cls, fn_name: str) -> bool:
-        return any(
-            fn_name.startswith(pattern) or fnmatch.fnmatch(pattern, fn_name)
-            for pattern in PytestConfigManager.fn_patterns()
+        return cls._fn_name_cache.get(
+            PytestConfigManager.fingerprint(),
+            fn_name,
+            lambda: (
+                cls.compile_fn_patterns(tuple(PytestConfigManager.fn_patterns())).match(fn_name)
+                is not None
+            ),
         )
+
+    @classmethod
+    @functools.cache
+    def compile_fn_patterns(cls, patterns: tuple[str, ...]) -> re.Pattern[str]:
+        return re.compile("|".join(map(cls._fn_pattern_regex, patterns)) or "(?!)")
+
+    @classmethod
+    def _fn_pattern_regex(cls, pattern: str) -> str:
+        if any(char in pattern for char in "*?["):
+            return fnmatch.translate(pattern)
+        return re.escape(pattern)
@@ -1,4 +1,11 @@
-from .test_name_checker import TestNameChecker
+from collections.abc import Sequence
+from pathlib import Path, PurePath
+
+from _pytest.pathlib import fnmatch_ex
+import pytest
+
+from .pytest_config_manager import PytestConfigManager
+from .test_name_checker import FilePatternMatcher, TestNameChecker
 
 
 def _fn_name_test_body(fullname: str, expected: bool) -> None:
@@ -19,3 +26,59 @@ def test_is_test_fn_fn_name_invalid() -> None:
 
 def test_is_test_fn_file_name_invalid() -> None:
     _fn_name_test_body("file.test_fn", False)
+
+
+@pytest.mark.parametrize(
+    "patterns, fn_name, expected",
+    [
+        (["test"], "test_fn", True),
+        (["test"], "fn_test", False),
+        (["check", "verify"], "verify_fn", True),
+        (["check_*_fn"], "check_all_fn", True),
+        (["check_*_fn"], "check_all_fn_2", False),
+        (["test.*"], "testing", False),
+        ([], "test_fn", False),
+    ],
+)
+def test_compile_fn_patterns(patterns: Sequence[str], fn_name: str, expected: bool) -> None:
+    regex = TestNameChecker.compile_fn_patterns(tuple(patterns))
+    assert (regex.match(fn_name) is not None) == expected
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "file_test.py",
+        "test_file.py",
+        "file.py",
+        "src/foo_test.py",
+        "src/tests/check.py",
+        "tests/check.py",
+        "/abs/src/tests/check.py",
+        "/abs/tests/check.py",
+    ],
+)
+def test_file_pattern_matcher_matches_fnmatch_ex(path: str) -> None:
+    patterns = ("*_test.py", "test_*.py", "src/tests/*.py")
+    matcher = FilePatternMatcher.compile(patterns)
+    assert matcher.matches(PurePath(path)) == any(
+        fnmatch_ex(pattern, PurePath(path)) for pattern in patterns
+    )
+
+
+def test_is_test_name_follows_config_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(PytestConfigManager, "REFRESH_INTERVAL", 0.0)
+    monkeypatch.setattr(PytestConfigManager, "_fingerprint", None)
+    config = tmp_path / "pytest.ini"
+    config.write_text("[pytest]\npython_files = check_*.py\npython_functions = check_\n")
+    assert TestNameChecker.is_test_file_name("src.check_foo")
+    assert not TestNameChecker.is_test_file_name("src.foo_test")
+    assert TestNameChecker.is_test_fn_name("check_foo")
+    config.write_text("[pytest]\npython_files = *_test.py\npython_functions = test\n")
+    assert not TestNameChecker.is_test_file_name("src.check_foo")
+    assert TestNameChecker.is_test_file_name("src.foo_test")
+    assert not TestNameChecker.is_test_fn_name("check_foo")
+    assert TestNameChecker.is_test_fn_name("test_foo")
@@ -1,5 +1,5 @@
 from collections.abc import Callable, Hashable, Iterable
-import functools
+from dataclasses import dataclass, field
 from typing import Any, overload
 
 
@@ -70,14 +70,40 @@ def _filter_unique_iterator(it: Iterable[Any], key: Callable[[Any], Any] | None)
             seen.add(value)
 
 
-def cache_by_id[*Ts, R](fn: Callable[[*Ts], R]) -> Callable[[*Ts], R]:
-    cache = {}
-
-    @functools.wraps(fn)
-    def wrapper(*args: *Ts) -> R:
-        key = tuple(map(id, args))
-        if key not in cache:
-            cache[key] = fn(*args)
-        return cache[key]
-
-    return wrapper
+@dataclass(slots=True)
+class ScopedCache[K: Hashable, V]:
+    maxsize: int | None = None
+    _scope: object = field(default=None, init=False)
+    _values: dict[K, V] = field(default_factory=dict, init=False)
+
+    def get(self, scope: object, key: K, compute: Callable[[], V]) -> V:
+        self._enter(scope)
+        try:
+            return self._values[key]
+        except KeyError:
+            ...
+        value = compute()
+        self.put(scope, key, value)
+        return value
+
+    def lookup(self, scope: object, key: K) -> V | None:
+        self._enter(scope)
+        return self._values.get(key)
+
+    def put(self, scope: object, key: K, value: V) -> None:
+        self._enter(scope)
+        if self.maxsize is not None and len(self._values) >= self.maxsize:
+            del self._values[next(iter(self._values))]
+        self._values[key] = value
+
+    def _enter(self, scope: object) -> None:
+        if scope is not self._scope:
+            self.clear()
+            self._scope = scope
+
+    def clear(self) -> None:
+        self._scope = None
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
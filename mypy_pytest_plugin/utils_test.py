@@ -1,11 +1,11 @@
 from collections.abc import Callable, Iterable, Sequence
-from dataclasses import dataclass
+import functools
 import itertools
 from typing import Any
 
 import pytest
 
-from .utils import cache_by_id, extract_singleton, filter_unique, strict_cast, strict_not_none
+from .utils import ScopedCache, extract_singleton, filter_unique, strict_cast, strict_not_none
 
 
 def test_strict_cast_type() -> None:
@@ -91,29 +91,25 @@ def test_unique_wrapper(n: int) -> None:
     assert list(count_to_n_twice(n)) == list(range(n))
 
 
-def test_cache_by_id() -> None:
-    id = 0
+def test_scoped_cache_reuses_values_within_scope() -> None:
+    cache: ScopedCache[int, object] = ScopedCache()
+    scope = object()
+    value = cache.get(scope, 0, object)
+    assert cache.get(scope, 0, object) is value
+    assert cache.get(scope, 1, object) is not value
 
-    @cache_by_id
-    def foo(*args: Any) -> int:
-        nonlocal id
-        return (id := id + 1)
 
-    assert foo() == foo()
-    assert foo(None) == foo(None)
+def test_scoped_cache_clears_on_new_scope() -> None:
+    cache: ScopedCache[int, object] = ScopedCache()
+    value = cache.get(object(), 0, object)
+    assert cache.get(object(), 0, object) is not value
+    assert len(cache) == 1
 
-    @dataclass(unsafe_hash=True)
-    class IntWrapper:
-        x: int
 
-    a = IntWrapper(0)
-    b = IntWrapper(0)
-    foo_a = foo(a)
-    foo_b = foo(b)
-    assert foo_a != foo_b
-
-    a.x += 1
-    b.x += 1
-
-    assert foo(a) == foo_a
-    assert foo(b) == foo_b
+def test_scoped_cache_evicts_oldest_beyond_maxsize() -> None:
+    cache: ScopedCache[int, int] = ScopedCache(maxsize=2)
+    scope = object()
+    for key in range(3):
+        cache.get(scope, key, functools.partial(int, key))
+    assert len(cache) == 2
+    assert cache.get(scope, 0, lambda: -1) == -1
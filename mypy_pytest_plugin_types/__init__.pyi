@@ -1,6 +1,5 @@
-from . import mock as mock
 from .fixture_type import FixtureType
 from .pytest import ParameterSet, param
 from .testable import Testable
 
-__all__ = ["FixtureType", "ParameterSet", "Testable", "mock", "param"]
+__all__ = ["FixtureType", "ParameterSet", "Testable", "param"]
@@ -470,6 +470,25 @@ class AsyncMockMixin:
 class AsyncMagicMixin(MagicMixin): ...
 
 class AsyncMock[**P, R](AsyncMockMixin, AsyncMagicMixin, Mock[P, R]):
+    # `AsyncMockMixin.__init__` accepts anything, which would leave `R` unbound.
+    def __init__(
+        self,
+        spec: Any | None = None,
+        side_effect: Callable[P, Any]
+        | Iterable[R | BaseException | type[BaseException]]
+        | BaseException
+        | type[BaseException]
+        | None = None,
+        return_value: R = ...,
+        wraps: Callable[P, Any] | None = None,
+        name: Any | None = None,
+        spec_set: Any | None = None,
+        parent: Any | None = None,
+        _spec_state: Any | None = None,
+        _new_name: Any = "",
+        _new_parent: Any | None = None,
+        **kwargs: Any,
+    ) -> None: ...
     # Improving the `reset_mock` signature.
     # It is defined on `AsyncMockMixin` with `*args, **kwargs`, which is not ideal.
     # But, `NonCallableMock` super-class has the better version.
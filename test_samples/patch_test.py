@@ -117,3 +117,12 @@ mock.patch("patch_test.value", mock.Mock(side_effect=[KeyboardInterrupt]))
 mock.patch("patch_test.value", mock.Mock(side_effect=[KeyboardInterrupt()]))
 mock.patch("patch_test.value", mock.Mock(side_effect=KeyboardInterrupt()))
 mock.patch("patch_test.value", mock.Mock(side_effect=KeyboardInterrupt))
+
+
+async def coroutine(x: int) -> str:
+    return str(x)
+
+
+mock.patch("patch_test.coroutine", mock.AsyncMock(return_value="value"))
+mock.patch("patch_test.coroutine", mock.AsyncMock(return_value=0))
+mock.patch("patch_test.coroutine", mock.Mock(return_value="value"))